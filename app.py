@@ -4,12 +4,13 @@ This is the entry point for the activity analytics dashboard.
 Run with: streamlit run app.py
 """
 
+import zlib
 import pandas as pd
 import streamlit as st
 from datetime import datetime
 
 from src.config import (
-    APP_TITLE, CUSTOM_CSS, DEFAULT_DAYS_BACK, 
+    APP_TITLE, CUSTOM_CSS_PATH, CUSTOM_CSS_URL, DEFAULT_DAYS_BACK, 
     MIN_DAYS_BACK, MAX_DAYS_BACK, DATA_FILE_PATH,
     PLOTLY_LIGHT_THEME, PLOTLY_DARK_THEME, VERSION,
     ACTIVITY_GROUP_MAP
@@ -24,7 +25,7 @@ from src.data_loader import (
 from src.utils import (
     calculate_fun_metrics, calculate_cheeky_metrics, get_personal_records, 
     calculate_summary_stats, format_metric_display, calculate_exercise_obsession_score,
-    get_races, get_best_race_times, is_race
+    get_races, get_best_race_times, get_race_mask
 )
 from src.visualizations_altair import (
     create_distance_timeline, create_activity_type_pie,
@@ -36,11 +37,37 @@ from src.visualizations_altair import (
     create_pace_speed_timeline, create_day_of_week_chart, create_month_of_year_chart
 )
 
+# The data_loader filters return slices of the loaded frame instead of
+# defensive copies, which relies on Copy-on-Write. It is always on from
+# pandas 3.0; opt in on 2.x.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+@st.cache_resource
+def get_custom_css_url() -> str:
+    """Return the stylesheet URL, cache-busted by a checksum of its contents.
+
+    Falls back to the plain URL when static/custom.css is not on disk, e.g.
+    when the package was installed without its static files.
+    """
+    try:
+        css = CUSTOM_CSS_PATH.read_bytes()
+    except OSError:
+        return CUSTOM_CSS_URL
+    version = f"{zlib.crc32(css):08x}"
+    return f"{CUSTOM_CSS_URL}?v={version}"
+
+
+def inject_css():
+    """Link the static stylesheet instead of inlining the CSS on every rerun."""
+    st.markdown(f'<link rel="stylesheet" href="{get_custom_css_url()}">', unsafe_allow_html=True)
+
 
 def setup_page():
     """Configure Streamlit page settings and custom styling."""
     st.set_page_config(page_title=APP_TITLE, layout="wide")
-    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+    inject_css()
     
     # Inject JavaScript to detect system dark mode preference
     st.markdown("""
@@ -278,7 +305,7 @@ def render_recent_activity_tab(df_filtered, days_back, theme):
     stats = calculate_summary_stats(df_filtered)
     render_summary_metrics(stats)
     
-    # Races count
+    # Races count (the races table below reuses these)
     races = get_races(df_filtered)
     if len(races) > 0:
         st.metric("🏁 Races in Period", f"{len(races):,}")
@@ -302,16 +329,13 @@ def render_recent_activity_tab(df_filtered, days_back, theme):
     st.subheader("Recent Activities")
     
     # Create formatted dataframe for display
-    temp_df = df_filtered.sort_values("Activity Date", ascending=False)[[
+    temp_df = df_filtered[[
         "Activity Date", "Activity Type", "Activity Group", "Distance (km)", 
         "Duration (min)", "Elevation (m)", "Average Speed (km/h)"
-    ]].copy()
+    ]].sort_values("Activity Date", ascending=False)
     
     # Calculate pace/speed based on activity type
-    def format_pace_speed(row):
-        activity_group = row["Activity Group"]
-        speed_kmh = row["Average Speed (km/h)"]
-        
+    def format_pace_speed(activity_group, speed_kmh):
         # Use pace for Running and Hiking
         if activity_group in ["Running", "Hiking"] and speed_kmh > 0:
             pace_min_per_km = 60 / speed_kmh
@@ -324,13 +348,19 @@ def render_recent_activity_tab(df_filtered, days_back, theme):
         else:
             return "-"
     
-    temp_df["Pace/Speed"] = temp_df.apply(format_pace_speed, axis=1)
+    temp_df["Pace/Speed"] = [
+        format_pace_speed(group, speed)
+        for group, speed in zip(
+            temp_df["Activity Group"].to_numpy(),
+            temp_df["Average Speed (km/h)"].to_numpy()
+        )
+    ]
     
     # Select and reorder columns for display
     display_df = temp_df[[
         "Activity Date", "Activity Type", "Distance (km)", 
         "Duration (min)", "Elevation (m)", "Pace/Speed"
-    ]].copy()
+    ]]
     
     # Format numeric columns
     display_df["Distance (km)"] = display_df["Distance (km)"].apply(lambda x: f"{x:,.1f}")
@@ -412,7 +442,6 @@ def render_recent_activity_tab(df_filtered, days_back, theme):
     # Races table
     st.markdown("---")
     st.subheader("🏁 Races")
-    races = get_races(df_filtered)
     
     if len(races) > 0:
         # Show race count
@@ -1028,10 +1057,7 @@ def render_alltime_tab(df, time_interval="quarterly", theme=None):
         if 'activity_preset' in st.session_state and st.session_state.activity_preset == "runner":
             # Calculate pace in min/km for runners
             # Get the original data to calculate pace
-            races_with_data = df[df.apply(
-                lambda row: is_race(row.get('Activity Name', ''), row.get('Activity Description', '')),
-                axis=1
-            )].copy()
+            races_with_data = df[get_race_mask(df)].copy()
             
             if len(races_with_data) > 0:
                 # Calculate pace: time in seconds / distance in km = seconds per km, then convert to min/km
@@ -1049,10 +1075,7 @@ def render_alltime_tab(df, time_interval="quarterly", theme=None):
                 races_display['Pace'] = races_with_data['Pace (min/km)'].apply(format_pace).values
         elif 'activity_preset' in st.session_state and st.session_state.activity_preset == "cyclist":
             # Show speed in km/h for cyclists
-            races_with_data = df[df.apply(
-                lambda row: is_race(row.get('Activity Name', ''), row.get('Activity Description', '')),
-                axis=1
-            )].copy()
+            races_with_data = df[get_race_mask(df)].copy()
             
             if len(races_with_data) > 0 and 'Average Speed (km/h)' in races_with_data.columns:
                 races_display['Speed (km/h)'] = races_with_data['Average Speed (km/h)'].apply(lambda x: f"{x:,.1f}").values
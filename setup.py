@@ -30,6 +30,8 @@ setup(
     install_requires=[
         "streamlit>=1.28.0",
         "pandas>=2.0.0",
+        "numpy>=1.24.0",
+        "pyarrow>=14.0.0",
         "altair>=5.0.0",
         "python-dateutil>=2.8.2",
     ],
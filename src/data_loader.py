@@ -1,39 +1,151 @@
+import calendar
+import csv
+import io
+import os
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, Union
+import pyarrow as pa
+import pyarrow.csv as pv
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import streamlit as st
 
-# Activity type to group mappings - Updated to match config.py
-ACTIVITY_GROUP_MAP = {
-    "Run": "Running",
-    "Virtual Run": "Running",
-    "Ride": "Cycling",
-    "Walk": "Hiking",
-    "Hike": "Hiking",
-    "Weight Training": "Strength",
-    "Workout": "Strength",
-    "Rowing": "Strength",
-    "Swim": "Swimming",
-    "Open Water Swim": "Swimming",
-    "Alpine Ski": "Winter Sports",
-    "Backcountry Ski": "Winter Sports",
-    "Nordic Ski": "Winter Sports",
-    "Snowboard": "Winter Sports",
-    "Rugby": "Team Sports",
-    "Football": "Team Sports",
-    "Netball": "Team Sports",
-    "Basketball": "Team Sports",
-    "Soccer": "Team Sports",
-    "Tennis": "Racket Sports",
-    "Squash": "Racket Sports",
-    "Badminton": "Racket Sports",
-    "Pickleball": "Racket Sports",
-    "Table Tennis": "Racket Sports",
-    "Racquetball": "Racket Sports",
-    "Water Sport": "Other",
-    "Unknown": "Other"
+from src.config import ACTIVITY_GROUP_MAP
+
+# Copy-on-Write is always on from pandas 3.0. On 2.x it is an opt-in global
+# option, which this module leaves alone, so it copies where it must instead.
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+# Activity type lookups are fixed for the life of the process, so they are
+# resolved once here. _GROUP_CODE_BY_TYPE[i] is the ACTIVITY_GROUPS code of the
+# i-th known type; its last entry is "Other", which an index of -1 (an
+# unmapped type) lands on.
+_KNOWN_ACTIVITY_TYPES = pd.Index(list(ACTIVITY_GROUP_MAP))
+ACTIVITY_GROUPS = pd.Index(sorted(set(ACTIVITY_GROUP_MAP.values()) | {"Other"}))
+_GROUP_CODE_BY_TYPE = ACTIVITY_GROUPS.get_indexer(list(ACTIVITY_GROUP_MAP.values()) + ["Other"])
+
+# Activities timed by Elapsed Time, and activities whose Distance is in meters
+STATIONARY_ACTIVITIES = frozenset(["Weight Training", "Workout", "Rowing", "Yoga"])
+METER_DISTANCE_ACTIVITIES = frozenset(["Swim", "Rowing"])
+
+DAY_OF_WEEK_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+TIME_OF_DAY_ORDER = ["Morning", "Afternoon", "Evening", "Night"]
+
+# Hour bin edges and the TIME_OF_DAY_ORDER code for each bin; hours before the
+# first edge or from the last edge onwards are Night
+TIME_OF_DAY_EDGES = np.array([5, 12, 17, 21])
+TIME_OF_DAY_CODES = np.array([3, 0, 1, 2, 3], dtype=np.int8)
+
+# Date format used in the Strava activities export, e.g. "Oct 21, 2012, 8:58:36 AM"
+STRAVA_DATE_FORMAT = "%b %d, %Y, %I:%M:%S %p"
+
+# Month abbreviations used in monthly period labels, e.g. "2024 Jan"
+_MONTH_ABBRS = np.array(calendar.month_abbr[1:])
+
+
+def _parse_activity_dates(raw_dates: pd.Series) -> pd.Series:
+    """
+    Parse activity dates, using the fixed Strava format where possible.
+    
+    An explicit format takes pandas' C parsing path instead of inferring the
+    format; values in any other format fall back to format inference.
+    
+    Args:
+        raw_dates: Activity date strings
+        
+    Returns:
+        Naive datetime Series, with NaT for values that could not be parsed.
+        Timezone-aware values (e.g. ISO dates ending in "Z") are converted
+        to UTC and their timezone dropped.
+    """
+    dates = pd.to_datetime(raw_dates, format=STRAVA_DATE_FORMAT, errors='coerce', cache=True)
+    unparsed = dates.isna() & raw_dates.notna()
+    if unparsed.any():
+        # Each leftover value is parsed on its own, so one odd format can't make
+        # the rest fail; utc=True accepts mixed offsets and leaves naive values as they are
+        fallback = pd.to_datetime(raw_dates[unparsed], format="mixed", errors='coerce', utc=True)
+        dates[unparsed] = fallback.dt.tz_convert(None)
+    return dates
+
+
+# Numeric columns the pipeline reads, parsed straight to float64 by Arrow
+_NUMERIC_COLUMN_TYPES = {
+    name: pa.float64()
+    for name in ("Distance", "Moving Time", "Elapsed Time", "Elevation Gain", "Average Speed")
 }
 
+
+# Columns of the Strava export the app uses. The export has ~100 columns
+# (gear, weather, heart rate, ...); the others are never parsed.
+USED_COLUMNS = [
+    "Activity Date", "Activity Name", "Activity Type", "Activity Description",
+    "Elapsed Time", "Distance", "Moving Time", "Average Speed", "Elevation Gain",
+]
+
+
+def _read_header(source: Union[str, io.BytesIO]) -> List[str]:
+    """
+    Read the column names from the first line of a CSV.
+    
+    Args:
+        source: Path to the CSV file or an in-memory binary buffer
+        
+    Returns:
+        Column names as they appear in the header
+    """
+    if isinstance(source, io.BytesIO):
+        first_line = source.getvalue().split(b"\n", 1)[0].decode("utf-8-sig", errors="replace")
+    else:
+        with open(source, newline="", encoding="utf-8-sig", errors="replace") as f:
+            first_line = f.readline()
+    return next(csv.reader([first_line]), [])
+
+
+def _read_csv(csv_path: Union[str, Any]) -> pd.DataFrame:
+    """
+    Read the used columns of a CSV file with the multithreaded PyArrow parser.
+    
+    Args:
+        csv_path: Path to the CSV file or a file-like object (text or binary)
+        
+    Returns:
+        DataFrame with the raw contents of the USED_COLUMNS present in the CSV
+    """
+    source = csv_path
+    if hasattr(csv_path, "read"):
+        data = csv_path.read()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        source = io.BytesIO(data)
+    
+    # Only parse the used columns that exist, in file order; a repeated header
+    # (e.g. the second "Distance") resolves to its first occurrence, as with pandas
+    include_columns = [
+        name for name in dict.fromkeys(_read_header(source)) if name in USED_COLUMNS
+    ]
+    
+    # Activity descriptions can contain quoted newlines, which Arrow only
+    # allows across its parse blocks when told to expect them
+    parse_options = pv.ParseOptions(newlines_in_values=True)
+    
+    # Empty fields become nulls (as with pandas) rather than empty strings
+    try:
+        table = pv.read_csv(source, parse_options=parse_options, convert_options=pv.ConvertOptions(
+            column_types=_NUMERIC_COLUMN_TYPES, strings_can_be_null=True,
+            include_columns=include_columns
+        ))
+    except pa.ArrowInvalid:
+        # A non-numeric value in a numeric column; read it untyped and leave
+        # it to pd.to_numeric in load_and_process_data to coerce
+        if hasattr(source, "seek"):
+            source.seek(0)
+        table = pv.read_csv(source, parse_options=parse_options, convert_options=pv.ConvertOptions(
+            strings_can_be_null=True, include_columns=include_columns
+        ))
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
 def load_and_process_data(csv_path: str) -> pd.DataFrame:
     """
     Load and process Strava activity data from CSV.
@@ -45,7 +157,7 @@ def load_and_process_data(csv_path: str) -> pd.DataFrame:
         Processed DataFrame with cleaned and derived columns
     """
     # Load CSV
-    df = pd.read_csv(csv_path)
+    df = _read_csv(csv_path)
     
     # Check for required columns
     required_columns = ["Activity Date", "Activity Type", "Distance"]
@@ -54,55 +166,57 @@ def load_and_process_data(csv_path: str) -> pd.DataFrame:
         raise ValueError(f"CSV missing required columns: {missing_columns}")
     
     # Parse activity date (which also contains time information)
-    df["Activity Date"] = pd.to_datetime(df["Activity Date"], errors='coerce')
-    
-    # Extract time of day information from Activity Date
-    df["Hour of Day"] = df["Activity Date"].dt.hour
-    df["Day of Week"] = df["Activity Date"].dt.day_name()
-    
-    # Create time of day categories
-    def categorize_time_of_day(hour):
-        if pd.isna(hour):
-            return "Unknown"
-        elif 5 <= hour < 12:
-            return "Morning"
-        elif 12 <= hour < 17:
-            return "Afternoon"
-        elif 17 <= hour < 21:
-            return "Evening"
-        else:
-            return "Night"
-    
-    df["Time of Day"] = df["Hour of Day"].apply(categorize_time_of_day)
-    
-    # Drop rows with invalid dates
-    df = df.dropna(subset=["Activity Date"])
-    
-    # Sort by date
-    df = df.sort_values("Activity Date")
-    
-    # Convert numeric columns to float, handling any non-numeric values
-    df["Distance"] = pd.to_numeric(df["Distance"], errors='coerce')
-    # Load both Moving Time and Elapsed Time if available
-    if "Moving Time" in df.columns:
-        df["Moving Time"] = pd.to_numeric(df["Moving Time"], errors='coerce')
-    if "Elapsed Time" in df.columns:
-        df["Elapsed Time"] = pd.to_numeric(df["Elapsed Time"], errors='coerce')
-    df["Elevation Gain"] = pd.to_numeric(df["Elevation Gain"], errors='coerce')
-    df["Average Speed"] = pd.to_numeric(df["Average Speed"], errors='coerce')
+    dates = _parse_activity_dates(df["Activity Date"]).to_numpy()
+    
+    # Drop rows with invalid dates and sort by date with a single row selection,
+    # so the wide raw frame is copied once rather than by dropna and again by sort
+    valid_rows = np.flatnonzero(~np.isnat(dates))
+    rows = valid_rows[np.argsort(dates[valid_rows], kind="stable")]
+    df = df.take(rows)
+    df["Activity Date"] = dates[rows]
+    
+    # Extract time of day information from Activity Date in one pass over
+    # the timestamps as integer seconds since the epoch (1970-01-01, a Thursday)
+    epoch_seconds = df["Activity Date"].to_numpy().astype("datetime64[s]").astype(np.int64)
+    hours = (epoch_seconds // 3600 % 24).astype(np.int8)
+    day_codes = (epoch_seconds // 86400 + 3) % 7  # 0 = Monday
+    df["Hour of Day"] = hours
+    df["Day of Week"] = pd.Categorical.from_codes(day_codes, categories=DAY_OF_WEEK_ORDER, ordered=True)
+    
+    # Create time of day categories by bucketing the hour against the bin edges:
+    # Morning 5-12, Afternoon 12-17, Evening 17-21, Night otherwise
+    df["Time of Day"] = pd.Categorical.from_codes(
+        TIME_OF_DAY_CODES[np.searchsorted(TIME_OF_DAY_EDGES, hours, side="right")],
+        categories=TIME_OF_DAY_ORDER
+    )
+    
+    # Convert numeric columns to float, handling any non-numeric values.
+    # _read_csv normally has Arrow parse these as float64 already, so only a
+    # column left as text by the untyped fallback read needs coercing.
+    for column in _NUMERIC_COLUMN_TYPES:
+        if column in df.columns and not pd.api.types.is_numeric_dtype(df[column]):
+            df[column] = pd.to_numeric(df[column], errors='coerce')
     
     # Handle activity types first (needed for time selection and distance conversion)
     df["Activity Type"] = df["Activity Type"].fillna("Unknown")
-    # Map activity types to groups, defaulting to "Other" for unmapped types
-    df["Activity Group"] = df["Activity Type"].map(ACTIVITY_GROUP_MAP).fillna("Other")
+    # Activity Type and Activity Group are stored as categoricals, so later
+    # groupbys and filters work on integer codes instead of strings.
+    # Map activity types to groups, defaulting to "Other" for unmapped types.
+    # Each distinct type is looked up in the precomputed tables once; rows are
+    # then filled by their type code.
+    df["Activity Type"] = df["Activity Type"].astype("category")
+    type_categories = df["Activity Type"].cat.categories
+    type_codes = df["Activity Type"].cat.codes.to_numpy()
+    group_codes = _GROUP_CODE_BY_TYPE[_KNOWN_ACTIVITY_TYPES.get_indexer(type_categories)]
+    df["Activity Group"] = pd.Categorical.from_codes(group_codes[type_codes], categories=ACTIVITY_GROUPS)
     
     # Use Elapsed Time for gym/stationary activities (where rest periods are part of workout),
     # Moving Time for movement-based activities (where stops should be excluded)
-    stationary_activities = ["Weight Training", "Workout", "Rowing", "Yoga"]
     if "Moving Time" in df.columns and "Elapsed Time" in df.columns:
-        # For stationary activities, use Elapsed Time
-        df["Time"] = df["Moving Time"]  # Default to Moving Time
-        df.loc[df["Activity Type"].isin(stationary_activities), "Time"] = df.loc[df["Activity Type"].isin(stationary_activities), "Elapsed Time"]
+        # For stationary activities, use Elapsed Time, otherwise Moving Time.
+        # The mask is resolved once per distinct type and selected with one np.where.
+        is_stationary = type_categories.isin(STATIONARY_ACTIVITIES)[type_codes]
+        df["Time"] = np.where(is_stationary, df["Elapsed Time"].to_numpy(), df["Moving Time"].to_numpy())
     elif "Moving Time" in df.columns:
         df["Time"] = df["Moving Time"]
     elif "Elapsed Time" in df.columns:
@@ -111,23 +225,65 @@ def load_and_process_data(csv_path: str) -> pd.DataFrame:
         raise ValueError("CSV must contain either 'Moving Time' or 'Elapsed Time' column")
     
     # Create derived columns
+    # Each column is computed and NaN-filled in place on its own float64 buffer,
+    # then everything is assigned back in one go
     # Swimming and Rowing distances in Strava CSV are in meters, convert to km
-    df["Distance (km)"] = df["Distance"].copy()
-    df.loc[df["Activity Type"] == "Swim", "Distance (km)"] = df.loc[df["Activity Type"] == "Swim", "Distance"] / 1000
-    df.loc[df["Activity Type"] == "Rowing", "Distance (km)"] = df.loc[df["Activity Type"] == "Rowing", "Distance"] / 1000
+    # by dividing just those rows in place on a copy of the Distance column
+    in_meters = type_categories.isin(METER_DISTANCE_ACTIVITIES)[type_codes]
+    distance_km = df["Distance"].to_numpy(dtype=np.float64, copy=True)
+    np.divide(distance_km, 1000, out=distance_km, where=in_meters)
+    np.nan_to_num(distance_km, copy=False)
+    
+    duration_min = np.nan_to_num(df["Time"].to_numpy(dtype=np.float64) / 60, copy=False)
+    elevation = np.nan_to_num(df["Elevation Gain"].to_numpy(dtype=np.float64, copy=True), copy=False)
+    speed = np.nan_to_num(df["Average Speed"].to_numpy(dtype=np.float64, copy=True), copy=False)
+    # Convert Average Speed from m/s to km/h
+    speed_kmh = speed * 3.6
+    
+    # Elevation (m) and Average Speed (km/h) are aliases for consistency with the rest of the app
+    df = df.assign(**{
+        "Elevation Gain": elevation,
+        "Average Speed": speed,
+        "Distance (km)": distance_km,
+        "Duration (min)": duration_min,
+        "Elevation (m)": elevation,
+        "Average Speed (km/h)": speed_kmh
+    })
     
-    df["Duration (min)"] = df["Time"] / 60
+    return df
+
+
+def count_values(values: pd.Series) -> Dict[str, int]:
+    """
+    Count occurrences of each value, most common first.
     
-    # Add aliases for consistency with the rest of the app
-    df["Elevation (m)"] = df["Elevation Gain"]
-    # Convert Average Speed from m/s to km/h
-    df["Average Speed (km/h)"] = df["Average Speed"] * 3.6
+    Counts dense integer codes with np.bincount instead of hashing each value;
+    categorical columns reuse their existing codes. Values with equal counts
+    keep the order in which they first appear, as `value_counts()` does for
+    plain (non-categorical) values, so a categorical column and its string
+    equivalent give the same result.
     
-    # Fill NaN values with 0 for numeric columns
-    numeric_cols = ["Distance (km)", "Duration (min)", "Elevation Gain", "Elevation (m)", "Average Speed", "Average Speed (km/h)"]
-    df[numeric_cols] = df[numeric_cols].fillna(0)
+    Args:
+        values: Series to count; missing values are ignored
+        
+    Returns:
+        Dictionary mapping each value to its count
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        # Categories in order of first appearance rather than category order
+        seen = values.unique().codes
+        seen = seen[seen >= 0]
+        counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))[seen]
+        uniques = values.cat.categories[seen]
+    else:
+        codes, uniques = pd.factorize(values)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
     
-    return df
+    order = np.argsort(-counts, kind="stable")
+    order = order[counts[order] > 0]
+    return dict(zip(uniques[order].tolist(), counts[order].tolist()))
+
 
 def get_summary_stats(df: pd.DataFrame) -> Dict[str, Any]:
     """
@@ -144,8 +300,8 @@ def get_summary_stats(df: pd.DataFrame) -> Dict[str, Any]:
         "total_distance_km": df["Distance (km)"].sum(),
         "total_duration_hours": df["Duration (min)"].sum() / 60,
         "total_elevation_gain_m": df["Elevation Gain"].sum(),
-        "activities_by_type": df["Activity Type"].value_counts().to_dict(),
-        "activities_by_group": df["Activity Group"].value_counts().to_dict(),
+        "activities_by_type": count_values(df["Activity Type"]),
+        "activities_by_group": count_values(df["Activity Group"]),
         "date_range": {
             "start": df["Activity Date"].min(),
             "end": df["Activity Date"].max()
@@ -153,18 +309,59 @@ def get_summary_stats(df: pd.DataFrame) -> Dict[str, Any]:
     }
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)
+def _load_file_cached(csv_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """
+    Load a CSV from disk, cached on its path, modification time and size.
+    
+    Args:
+        csv_path: Path to the CSV file
+        mtime_ns: File modification time, only used as part of the cache key
+        size: File size in bytes, only used as part of the cache key
+        
+    Returns:
+        Processed DataFrame
+    """
+    return load_and_process_data(csv_path)
+
+
+@st.cache_resource(ttl=3600)
+def _load_upload_cached(data_source: Any) -> pd.DataFrame:
+    """
+    Load an uploaded CSV, cached on the file's contents.
+    
+    Args:
+        data_source: Uploaded file object
+        
+    Returns:
+        Processed DataFrame
+    """
+    return load_and_process_data(data_source)
+
+
 def load_strava_data(data_source: Union[str, Any]) -> pd.DataFrame:
     """
     Load and process Strava activity data with caching.
     
+    Files on disk are cached on their modification time and size, so an
+    edited file is reloaded and an unchanged one is never re-parsed. The
+    cached frame is held as a resource, so a hit skips both hashing and
+    unpickling the DataFrame. Callers get a copy they can modify without
+    touching the cached frame: a shallow one on pandas 3, where Copy-on-Write
+    is always on, and a deep one on pandas 2.
+    
     Args:
         data_source: Either a file path (str) or an uploaded file object
         
     Returns:
         Processed DataFrame with cleaned and derived columns
     """
-    return load_and_process_data(data_source)
+    if isinstance(data_source, (str, os.PathLike)):
+        stat = os.stat(data_source)
+        df = _load_file_cached(os.fspath(data_source), stat.st_mtime_ns, stat.st_size)
+    else:
+        df = _load_upload_cached(data_source)
+    return df.copy(deep=not _COPY_ON_WRITE)
 
 
 def filter_by_activities(df: pd.DataFrame, selected_activities: list) -> pd.DataFrame:
@@ -184,9 +381,16 @@ def filter_by_activities(df: pd.DataFrame, selected_activities: list) -> pd.Data
     
     # Special marker for intentionally showing no activities
     if selected_activities == ["__NONE__"]:
-        return df[df["Activity Group"].isin([])].copy()  # Returns empty DataFrame
+        return df.iloc[:0]  # Returns empty DataFrame
+    
+    groups = df["Activity Group"]
+    if isinstance(groups.dtype, pd.CategoricalDtype):
+        # Resolve the selection once per category, then gather it by code; the
+        # trailing False is what a missing value's code of -1 picks up
+        wanted = np.append(groups.cat.categories.isin(selected_activities), False)
+        return df[wanted[groups.cat.codes.to_numpy()]]
     
-    return df[df["Activity Group"].isin(selected_activities)].copy()
+    return df[groups.isin(selected_activities)]
 
 
 def filter_by_date_range(df: pd.DataFrame, days_back: int) -> pd.DataFrame:
@@ -200,8 +404,148 @@ def filter_by_date_range(df: pd.DataFrame, days_back: int) -> pd.DataFrame:
     Returns:
         Filtered DataFrame
     """
-    cutoff_date = datetime.now() - timedelta(days=days_back)
-    return df[df["Activity Date"] >= cutoff_date].copy()
+    # Native datetime64 cutoff so the comparison never boxes to Python datetimes
+    cutoff_date = np.datetime64(datetime.now() - timedelta(days=days_back), "ns")
+    return df[df["Activity Date"].to_numpy() >= cutoff_date]
+
+
+def _period_ordinals(dates: pd.Series, time_interval: str) -> Tuple[np.ndarray, Optional[str]]:
+    """
+    Number each date's month, quarter or year since 1970.
+    
+    The ordinals come from a single datetime64[M] truncation of the dates, so
+    no per-row Period or string objects are created.
+    
+    Args:
+        dates: Activity dates
+        time_interval: "monthly", "quarterly", "annual" or "alltime"; anything
+                       else falls back to quarterly
+        
+    Returns:
+        Tuple of the integer ordinals and the pandas period frequency ("M",
+        "Q" or "Y"); for "alltime" every ordinal is 0 and the frequency is None
+    """
+    months = dates.to_numpy().astype("datetime64[M]").astype(np.int64)
+    
+    if time_interval == "monthly":
+        return months, "M"
+    if time_interval == "annual":
+        return months // 12, "Y"
+    if time_interval == "alltime":
+        return np.zeros(len(months), dtype=np.int64), None
+    return months // 3, "Q"
+
+
+def _ordinal_labels(ordinals: np.ndarray, freq: str) -> np.ndarray:
+    """
+    Format ordinals from _period_ordinals as display labels.
+    
+    The year and month or quarter are recovered with integer arithmetic and
+    joined with NumPy string operations, so no Period objects are formatted.
+    
+    Args:
+        ordinals: Integer period ordinals
+        freq: Period frequency returned alongside them
+        
+    Returns:
+        Array of labels such as "2024 Jan", "2024Q1" or "2024"
+    """
+    if freq == "Y":
+        return (ordinals + 1970).astype(str)
+    if freq == "Q":
+        years = (ordinals // 4 + 1970).astype(str)
+        return np.char.add(np.char.add(years, "Q"), (ordinals % 4 + 1).astype(str))
+    years = (ordinals // 12 + 1970).astype(str)
+    return np.char.add(np.char.add(years, " "), _MONTH_ABBRS[ordinals % 12])
+
+
+def get_period_categories(dates: pd.Series, time_interval: str) -> pd.Categorical:
+    """
+    Label each date with its display period as an ordered categorical.
+    
+    Labels are only built for the distinct periods, and the categories are in
+    chronological order, so grouping on the result sorts by date rather than
+    alphabetically.
+    
+    Args:
+        dates: Activity dates
+        time_interval: Time interval ("monthly", "quarterly", "annual", "alltime")
+        
+    Returns:
+        Categorical of labels such as "2024 Jan", "2024Q1", "2024" or "All Time"
+    """
+    ordinals, freq = _period_ordinals(dates, time_interval)
+    uniques, codes = np.unique(ordinals, return_inverse=True)
+    
+    if freq is None:
+        labels = ["All Time"] * len(uniques)
+    else:
+        labels = _ordinal_labels(uniques, freq)
+    
+    return pd.Categorical.from_codes(codes.ravel(), categories=labels, ordered=True)
+
+
+def _aggregate_by_period(df: pd.DataFrame, time_interval: str,
+                         by: Optional[str] = None) -> pd.DataFrame:
+    """
+    Sum distance, duration and elevation and count activities per period.
+    
+    Each row's period ordinal (combined with the `by` column's category code)
+    is reduced to a dense group number with np.unique, and every column is
+    then summed with a weighted np.bincount. This avoids a pandas groupby
+    entirely, sorts chronologically, and only builds labels for the unique
+    periods in the result.
+    
+    Args:
+        df: Activity DataFrame
+        time_interval: "monthly", "quarterly", "annual" or "alltime"; anything
+                       else falls back to quarterly
+        by: Optional extra column to group by after the period
+        
+    Returns:
+        DataFrame with Period, the optional `by` column, Distance, Duration,
+        Elevation and Activity Count, sorted by period. Period holds display
+        labels (e.g. "2024 Jan", "2024Q1", "2024"), or "All Time" for "alltime".
+    """
+    keys, freq = _period_ordinals(df["Activity Date"], time_interval)
+    rows = slice(None)
+    
+    if by is not None:
+        by_values = df[by]
+        if not isinstance(by_values.dtype, pd.CategoricalDtype):
+            by_values = by_values.astype("category")
+        by_categories = by_values.cat.categories
+        by_codes = by_values.cat.codes.to_numpy(dtype=np.int64)
+        
+        # Rows with a missing `by` value are left out, as groupby would
+        rows = by_codes >= 0
+        keys = keys[rows] * len(by_categories) + by_codes[rows]
+    
+    uniques, groups = np.unique(keys, return_inverse=True)
+    groups = groups.ravel()
+    
+    def group_sum(column: str) -> np.ndarray:
+        values = np.nan_to_num(df[column].to_numpy(dtype=np.float64)[rows])
+        return np.bincount(groups, weights=values, minlength=len(uniques))
+    
+    if by is None:
+        aggregated = pd.DataFrame({"Period": uniques})
+    else:
+        aggregated = pd.DataFrame({
+            "Period": uniques // len(by_categories),
+            by: by_categories[uniques % len(by_categories)].to_numpy()
+        })
+    aggregated["Distance"] = group_sum("Distance (km)")
+    aggregated["Duration"] = group_sum("Duration (min)")
+    aggregated["Elevation"] = group_sum("Elevation Gain")
+    aggregated["Activity Count"] = np.bincount(groups, minlength=len(uniques))
+    
+    if freq is None:
+        aggregated["Period"] = "All Time"
+    else:
+        aggregated["Period"] = _ordinal_labels(aggregated["Period"].to_numpy(), freq)
+    
+    return aggregated
 
 
 def get_quarterly_stats(df: pd.DataFrame) -> pd.DataFrame:
@@ -212,25 +556,17 @@ def get_quarterly_stats(df: pd.DataFrame) -> pd.DataFrame:
         df: Activity DataFrame
         
     Returns:
-        DataFrame with quarterly aggregated statistics
+        DataFrame with quarterly aggregated statistics, in chronological
+        order, labelled e.g. "2024Q1"
     """
     if len(df) == 0:
         return pd.DataFrame()
     
-    df_copy = df.copy()
-    df_copy["Quarter"] = df_copy["Activity Date"].dt.to_period("Q").astype(str)
-    
-    quarterly = df_copy.groupby("Quarter").agg({
-        "Distance (km)": "sum",
-        "Duration (min)": "sum",
-        "Elevation Gain": "sum",
-        "Activity Type": "count"
-    }).reset_index()
-    
-    quarterly.columns = ["Quarter", "Distance", "Duration", "Elevation", "Activity Count"]
+    quarterly = _aggregate_by_period(df, "quarterly")
+    quarterly = quarterly.rename(columns={"Period": "Quarter"})
     quarterly["Duration (hours)"] = (quarterly["Duration"] / 60).round(1)
     
-    return quarterly.sort_values("Quarter")
+    return quarterly
 
 
 def get_monthly_trends(df: pd.DataFrame) -> pd.DataFrame:
@@ -241,25 +577,17 @@ def get_monthly_trends(df: pd.DataFrame) -> pd.DataFrame:
         df: Activity DataFrame
         
     Returns:
-        DataFrame with monthly aggregated statistics
+        DataFrame with monthly aggregated statistics, in chronological
+        order, labelled e.g. "2024 Jan"
     """
     if len(df) == 0:
         return pd.DataFrame()
     
-    df_copy = df.copy()
-    df_copy["Month"] = df_copy["Activity Date"].dt.strftime("%Y %b")
-    
-    monthly = df_copy.groupby("Month").agg({
-        "Distance (km)": "sum",
-        "Duration (min)": "sum",
-        "Elevation Gain": "sum",
-        "Activity Type": "count"
-    }).reset_index()
-    
-    monthly.columns = ["Month", "Distance", "Duration", "Elevation", "Activity Count"]
+    monthly = _aggregate_by_period(df, "monthly")
+    monthly = monthly.rename(columns={"Period": "Month"})
     monthly["Duration (hours)"] = (monthly["Duration"] / 60).round(1)
     
-    return monthly.sort_values("Month")
+    return monthly
 
 
 def get_aggregated_trends(df: pd.DataFrame, time_interval: str = "quarterly") -> pd.DataFrame:
@@ -276,34 +604,11 @@ def get_aggregated_trends(df: pd.DataFrame, time_interval: str = "quarterly") ->
     if len(df) == 0:
         return pd.DataFrame()
     
-    df_copy = df.copy()
-    
-    if time_interval == "monthly":
-        df_copy["Period"] = df_copy["Activity Date"].dt.strftime("%Y %b")
-    elif time_interval == "quarterly":
-        df_copy["Period"] = df_copy["Activity Date"].dt.to_period("Q").astype(str)
-    elif time_interval == "annual":
-        df_copy["Period"] = df_copy["Activity Date"].dt.to_period("Y").astype(str)
-    elif time_interval == "alltime":
-        # For alltime, aggregate everything into a single period
-        df_copy["Period"] = "All Time"
-    else:
-        # Default to quarterly
-        df_copy["Period"] = df_copy["Activity Date"].dt.to_period("Q").astype(str)
-    
-    aggregated = df_copy.groupby("Period").agg({
-        "Distance (km)": "sum",
-        "Duration (min)": "sum",
-        "Elevation Gain": "sum",
-        "Activity Type": "count"
-    }).reset_index()
-    
-    aggregated.columns = ["Period", "Distance", "Duration", "Elevation", "Activity Count"]
-    aggregated["Duration (hours)"] = (aggregated["Duration"] / 60).round(1)
+    aggregated = _aggregate_by_period(df, time_interval)
+    aggregated["Duration (hours)"] = np.round(aggregated["Duration"].to_numpy() / 60, 1)
     
-    # Calculate cumulative distance
-    aggregated = aggregated.sort_values("Period")
-    aggregated["Cumulative Distance"] = aggregated["Distance"].cumsum()
+    # Calculate cumulative distance; rows are already in period order from the groupby
+    aggregated["Cumulative Distance"] = np.cumsum(aggregated["Distance"].to_numpy())
     
     return aggregated
 
@@ -322,30 +627,13 @@ def get_stacked_activity_data(df: pd.DataFrame, time_interval: str = "quarterly"
     if len(df) == 0:
         return pd.DataFrame()
     
-    df_copy = df.copy()
+    aggregated = _aggregate_by_period(df, time_interval, by="Activity Group")
     
-    if time_interval == "monthly":
-        df_copy["Period"] = df_copy["Activity Date"].dt.strftime("%Y %b")
-    elif time_interval == "quarterly":
-        df_copy["Period"] = df_copy["Activity Date"].dt.to_period("Q").astype(str)
-    elif time_interval == "annual":
-        df_copy["Period"] = df_copy["Activity Date"].dt.to_period("Y").astype(str)
-    elif time_interval == "alltime":
-        # For alltime, aggregate everything into a single period
-        df_copy["Period"] = "All Time"
-    else:
-        # Default to quarterly
-        df_copy["Period"] = df_copy["Activity Date"].dt.to_period("Q").astype(str)
+    stacked = aggregated[["Period", "Activity Group", "Activity Count", "Distance"]].rename(
+        columns={"Activity Count": "Count"}
+    )
     
-    # Group by period and activity group
-    stacked = df_copy.groupby(["Period", "Activity Group"]).agg({
-        "Activity Type": "count",
-        "Distance (km)": "sum"
-    }).reset_index()
-    
-    stacked.columns = ["Period", "Activity Group", "Count", "Distance"]
-    
-    return stacked.sort_values("Period")
+    return stacked
 
 
 def get_time_of_day_stats(df: pd.DataFrame) -> Dict[str, Any]:
@@ -361,10 +649,10 @@ def get_time_of_day_stats(df: pd.DataFrame) -> Dict[str, Any]:
     if "Time of Day" not in df.columns or len(df) == 0:
         return {}
     
-    time_of_day_counts = df["Time of Day"].value_counts().to_dict()
+    time_of_day_counts = count_values(df["Time of Day"])
     
     # Calculate performance metrics by time of day
-    time_stats = df.groupby("Time of Day").agg({
+    time_stats = df.groupby("Time of Day", observed=True).agg({
         "Distance (km)": ["sum", "mean"],
         "Duration (min)": ["sum", "mean"],
         "Average Speed (km/h)": "mean",
@@ -374,7 +662,8 @@ def get_time_of_day_stats(df: pd.DataFrame) -> Dict[str, Any]:
     return {
         "counts": time_of_day_counts,
         "stats": time_stats,
-        "most_active": max(time_of_day_counts, key=time_of_day_counts.get) if time_of_day_counts else "Unknown"
+        # Counts are most common first; ties go to the slot seen first in the data
+        "most_active": next(iter(time_of_day_counts), "Unknown")
     }
 
 
@@ -419,18 +708,24 @@ def get_day_hour_heatmap_data(df: pd.DataFrame) -> pd.DataFrame:
     if "Hour of Day" not in df.columns or "Day of Week" not in df.columns or len(df) == 0:
         return pd.DataFrame()
     
-    # Create day-hour combinations
-    heatmap_data = df.groupby(["Day of Week", "Hour of Day"]).agg({
-        "Activity Type": "count"
-    }).reset_index()
-    
-    heatmap_data.columns = ["Day", "Hour", "Count"]
-    
-    # Order days of week
-    day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    heatmap_data["Day"] = pd.Categorical(heatmap_data["Day"], categories=day_order, ordered=True)
-    
-    return heatmap_data.sort_values(["Day", "Hour"])
+    # Count every (day, hour) cell with one bincount over day_code * 24 + hour;
+    # Day of Week is normally already an ordered categorical
+    days = df["Day of Week"]
+    if not isinstance(days.dtype, pd.CategoricalDtype):
+        days = days.astype(pd.CategoricalDtype(DAY_OF_WEEK_ORDER, ordered=True))
+    day_codes = days.cat.codes.to_numpy(dtype=np.int64)
+    hours = df["Hour of Day"].to_numpy(dtype=np.int64)
+    
+    valid = day_codes >= 0
+    counts = np.bincount(day_codes[valid] * 24 + hours[valid], minlength=7 * 24)
+    
+    # Only cells with activities are returned, in day then hour order
+    cells = np.flatnonzero(counts)
+    return pd.DataFrame({
+        "Day": pd.Categorical.from_codes(cells // 24, categories=DAY_OF_WEEK_ORDER, ordered=True),
+        "Hour": (cells % 24).astype(df["Hour of Day"].dtype),
+        "Count": counts[cells]
+    })
 
 
 def get_day_of_week_stats(df: pd.DataFrame) -> pd.DataFrame:
@@ -446,12 +741,8 @@ def get_day_of_week_stats(df: pd.DataFrame) -> pd.DataFrame:
     if "Day of Week" not in df.columns or len(df) == 0:
         return pd.DataFrame()
     
-    # Count activities by day of week
-    day_counts = df.groupby("Day of Week").size().reset_index(name="Count")
-    
-    # Order days of week
-    day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    day_counts["Day of Week"] = pd.Categorical(day_counts["Day of Week"], categories=day_order, ordered=True)
+    # Count activities by day of week, in calendar order
+    day_counts = df.groupby("Day of Week", observed=True).size().reset_index(name="Count")
     day_counts = day_counts.sort_values("Day of Week")
     
     # Calculate percentage
@@ -473,12 +764,10 @@ def get_month_of_year_stats(df: pd.DataFrame) -> pd.DataFrame:
     if "Activity Date" not in df.columns or len(df) == 0:
         return pd.DataFrame()
     
-    # Extract month from date
-    df_copy = df.copy()
-    df_copy["Month"] = df_copy["Activity Date"].dt.month_name()
-    
-    # Count activities by month
-    month_counts = df_copy.groupby("Month").size().reset_index(name="Count")
+    # Count activities by month name, grouping on the derived Series so the
+    # frame itself is never copied
+    months = df["Activity Date"].dt.month_name().rename("Month")
+    month_counts = df.groupby(months).size().reset_index(name="Count")
     
     # Order months
     month_order = ["January", "February", "March", "April", "May", "June", 
@@ -4,10 +4,120 @@ This module provides helper functions for computing interesting statistics
 about activities, such as personal records and comparative metrics.
 """
 
+import re
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from typing import Dict, Tuple
 
-from src.config import EARTH_CIRCUMFERENCE_KM, EVEREST_HEIGHT_M, WEEKS_PER_YEAR
+from src.config import (
+    EARTH_CIRCUMFERENCE_KM, EVEREST_HEIGHT_M, WEEKS_PER_YEAR,
+    MARATHON_KM, BANANA_LENGTH_M, FOOTBALL_PITCH_M,
+    EIFFEL_TOWER_M, EMPIRE_STATE_M, BURJ_KHALIFA_M,
+    FRIENDS_EPISODE_MIN, LOTR_TRILOGY_MIN,
+    CALORIES_PER_KM, BIG_MAC_CALORIES, PIZZA_SLICE_CALORIES, BEER_CALORIES,
+    SLOTH_SPEED_KMH, USAIN_BOLT_KMH
+)
+
+# Obsession score bands: a score at or above _OBSESSION_THRESHOLDS[i] reaches
+# _OBSESSION_LEVELS[i + 1]; anything below the first threshold is level 0
+_OBSESSION_THRESHOLDS = np.array([10, 25, 40, 55, 70, 85])
+_OBSESSION_LEVELS = (
+    ("Couch Enthusiast 🛋️", "You're more of a 'spiritual' athlete. Thinking about it counts, right?"),
+    ("Casual Dabbler 🚶", "You exercise sometimes. When you remember. Or when your jeans get tight."),
+    ("Weekend Warrior ⚽", "Mondays are for recovery. And Tuesdays. Actually, most days really."),
+    ("Enthusiastic Amateur 🚴", "You're keen when the weather's nice. Mostly nice."),
+    ("Committed Crusher 🏃", "You've got a routine and you stick to it. Rain or shine, you're out there."),
+    ("Fitness Fanatic 💪", "Your gear is always ready to go. Exercise is a lifestyle, not a hobby."),
+    ("Exercise Addict 🔥", "You probably dream about workouts. Your rest days need rest days."),
+)
+
+
+def _activity_totals(df: pd.DataFrame) -> Tuple[float, float, float]:
+    """Sum distance, elevation and duration over all activities.
+    
+    Each column is reduced once with NumPy, skipping missing values as
+    pandas' sum does, so the metric functions never sum a column twice.
+    The columns are summed one by one on their existing buffers; stacking
+    them into a 2-D array first costs a copy and is several times slower.
+    
+    Args:
+        df: DataFrame with Distance (km), Elevation (m) and Duration (min) columns.
+        
+    Returns:
+        Tuple of (total distance in km, total elevation in m, total duration in min).
+    """
+    return tuple(
+        np.nansum(df[column].to_numpy())
+        for column in ('Distance (km)', 'Elevation (m)', 'Duration (min)')
+    )
+
+
+def _nanmax(values: np.ndarray) -> float:
+    """Take the maximum of an array, skipping NaNs as pandas' max does.
+    
+    Unlike np.nanmax, an empty or all-NaN array gives NaN without a warning.
+    
+    Args:
+        values: Float array to reduce.
+        
+    Returns:
+        Largest non-NaN value, or NaN if there is none.
+    """
+    values = values[~np.isnan(values)]
+    return values.max() if len(values) else np.float64(np.nan)
+
+
+def _date_span_days(dates: pd.Series) -> int:
+    """Count the whole days between the first and last activity.
+    
+    The span is one np.ptp reduction on the datetime64 array, so no
+    Timestamps are created.
+    
+    Args:
+        dates: Activity dates; missing dates are ignored.
+        
+    Returns:
+        Whole days from the earliest to the latest date, or 0 if there are
+        no dates.
+    """
+    values = dates.to_numpy()
+    values = values[~np.isnat(values)]
+    if len(values) == 0:
+        return 0
+    return int(np.ptp(values) // np.timedelta64(1, 'D'))
+
+
+def _day_numbers(dates: pd.Series) -> np.ndarray:
+    """Convert activity dates to whole days since 1970-01-01.
+    
+    Weeks and weekdays are both derived from these integers, so the date
+    column is only converted once.
+    
+    Args:
+        dates: Activity dates; missing dates are dropped.
+        
+    Returns:
+        int64 array of day numbers (negative before 1970).
+    """
+    values = dates.to_numpy()
+    return values[~np.isnat(values)].astype('datetime64[D]').astype(np.int64)
+
+
+def _count_active_weeks(days: np.ndarray) -> int:
+    """Count the distinct Monday-to-Sunday weeks that contain an activity.
+    
+    Matches dt.to_period('W').nunique(), but works on integer day numbers
+    instead of boxing every date into a Period.
+    
+    Args:
+        days: Day numbers from _day_numbers.
+        
+    Returns:
+        Number of distinct weeks with at least one activity.
+    """
+    # Day 0 (1970-01-01) was a Thursday, so shift by 3 to start weeks on Monday
+    return np.unique((days + 3) // 7).size
 
 
 def calculate_exercise_obsession_score(df: pd.DataFrame) -> Tuple[int, str, str]:
@@ -30,65 +140,46 @@ def calculate_exercise_obsession_score(df: pd.DataFrame) -> Tuple[int, str, str]
         >>> print(f"You're a {level} scoring {score}/100!")
     """
     total_activities = len(df)
-    date_range_days = (df['Activity Date'].max() - df['Activity Date'].min()).days
+    date_range_days = _date_span_days(df['Activity Date'])
+    days = _day_numbers(df['Activity Date'])
     
     if date_range_days == 0:
         date_range_days = 1
     
     # Factor 1: Activities per week (0-25 points)
     activities_per_week = (total_activities / date_range_days) * 7
-    frequency_score = min(25, activities_per_week * 5)  # Cap at 25
+    frequency_score = activities_per_week * 5
     
     # Factor 2: Total hours spent (0-25 points) 
-    total_hours = df['Duration (min)'].sum() / 60
+    total_hours = np.nansum(df['Duration (min)'].to_numpy()) / 60
     hours_per_week = (total_hours / date_range_days) * 7
-    volume_score = min(25, hours_per_week * 2.5)  # 10 hrs/week = max
+    volume_score = hours_per_week * 2.5  # 10 hrs/week = max
     
     # Factor 3: Consistency - how many weeks have activities (0-20 points)
-    df_with_week = df.copy()
-    df_with_week['week'] = df_with_week['Activity Date'].dt.to_period('W')
-    active_weeks = df_with_week['week'].nunique()
+    active_weeks = _count_active_weeks(days)
     total_weeks = max(1, date_range_days / 7)
     consistency_score = (active_weeks / total_weeks) * 20
     
     # Factor 4: Variety of activities (0-15 points)
     unique_activities = df['Activity Type'].nunique()
-    variety_score = min(15, unique_activities * 3)  # 5+ types = max
+    variety_score = unique_activities * 3  # 5+ types = max
     
     # Factor 5: Weekend warrior vs daily grind (0-15 points)
-    df_with_day = df.copy()
-    df_with_day['day_of_week'] = df_with_day['Activity Date'].dt.dayofweek
-    weekend_activities = len(df_with_day[df_with_day['day_of_week'].isin([5, 6])])
+    day_of_week = (days + 3) % 7  # 0 = Monday, so 5 and 6 are the weekend
+    weekend_activities = int(np.count_nonzero(day_of_week >= 5))
     weekday_activities = total_activities - weekend_activities
     balance_ratio = min(weekday_activities, weekend_activities) / max(1, total_activities)
     dedication_score = balance_ratio * 15
     
-    # Total score
-    total_score = int(frequency_score + volume_score + consistency_score + 
-                     variety_score + dedication_score)
-    
-    # Determine level and description
-    if total_score >= 85:
-        level = "Exercise Addict 🔥"
-        description = "You probably dream about workouts. Your rest days need rest days."
-    elif total_score >= 70:
-        level = "Fitness Fanatic 💪"
-        description = "Your gear is always ready to go. Exercise is a lifestyle, not a hobby."
-    elif total_score >= 55:
-        level = "Committed Crusher 🏃"
-        description = "You've got a routine and you stick to it. Rain or shine, you're out there."
-    elif total_score >= 40:
-        level = "Enthusiastic Amateur 🚴"
-        description = "You're keen when the weather's nice. Mostly nice."
-    elif total_score >= 25:
-        level = "Weekend Warrior ⚽"
-        description = "Mondays are for recovery. And Tuesdays. Actually, most days really."
-    elif total_score >= 10:
-        level = "Casual Dabbler 🚶"
-        description = "You exercise sometimes. When you remember. Or when your jeans get tight."
-    else:
-        level = "Couch Enthusiast 🛋️"
-        description = "You're more of a 'spiritual' athlete. Thinking about it counts, right?"
+    # Total score: cap each factor at its maximum points and add them up
+    factors = np.array([frequency_score, volume_score, consistency_score,
+                        variety_score, dedication_score])
+    caps = np.array([25, 25, 20, 15, 15])
+    total_score = int(np.minimum(factors, caps).sum())
+    
+    # Determine level and description from the band the score falls in
+    band = int(np.searchsorted(_OBSESSION_THRESHOLDS, total_score, side='right'))
+    level, description = _OBSESSION_LEVELS[band]
     
     return total_score, level, description
 
@@ -110,53 +201,39 @@ def calculate_cheeky_metrics(df: pd.DataFrame) -> Dict[str, any]:
         >>> metrics = calculate_cheeky_metrics(df)
         >>> print(f"You burned {metrics['big_macs']:.0f} Big Macs worth of calories!")
     """
-    total_distance = df['Distance (km)'].sum()
-    total_elevation = df['Elevation (m)'].sum()
-    total_hours = df['Duration (min)'].sum() / 60
-    total_minutes = df['Duration (min)'].sum()
+    total_distance, total_elevation, total_minutes = _activity_totals(df)
+    total_hours = total_minutes / 60
     
     # Distance comparisons
-    banana_length_m = 0.18  # Average banana is 18cm (USDA)
-    football_pitch_m = 105  # Standard football pitch length (FIFA/Premier League)
-    marathons = total_distance / 42.195  # Official marathon distance (IAAF)
-    bananas = (total_distance * 1000) / banana_length_m
-    football_pitches = (total_distance * 1000) / football_pitch_m
+    marathons = total_distance / MARATHON_KM
+    bananas = (total_distance * 1000) / BANANA_LENGTH_M
+    football_pitches = (total_distance * 1000) / FOOTBALL_PITCH_M
     
     # Elevation comparisons
-    eiffel_tower_m = 330  # To the tip (Paris official)
-    empire_state_m = 443  # To the roof (ESB official)
-    burj_khalifa_m = 828  # Total height (Emaar Properties)
-    eiffel_towers = total_elevation / eiffel_tower_m
-    empire_states = total_elevation / empire_state_m
-    burj_khalifas = total_elevation / burj_khalifa_m
+    eiffel_towers = total_elevation / EIFFEL_TOWER_M
+    empire_states = total_elevation / EMPIRE_STATE_M
+    burj_khalifas = total_elevation / BURJ_KHALIFA_M
     
     # Time comparisons
-    friends_episode_min = 22  # Average runtime without ads (NBC)
-    lotr_trilogy_min = 558  # Extended editions total (New Line Cinema)
-    friends_episodes = total_minutes / friends_episode_min
-    lotr_trilogies = total_minutes / lotr_trilogy_min
+    friends_episodes = total_minutes / FRIENDS_EPISODE_MIN
+    lotr_trilogies = total_minutes / LOTR_TRILOGY_MIN
     
     # Calorie comparisons
-    # Estimated: ~50 cal/km for running/cycling mix (Mayo Clinic)
-    estimated_calories = total_distance * 50
-    big_mac_calories = 563  # McDonald's official nutrition info
-    pizza_slice_calories = 285  # Large pepperoni, 1/8 pizza (USDA)
-    beer_calories = 150  # Average 12oz beer (USDA)
-    big_macs = estimated_calories / big_mac_calories
-    pizza_slices = estimated_calories / pizza_slice_calories
-    beers = estimated_calories / beer_calories
-    
-    # Speed comparisons (based on distance traveled at avg speed)
-    avg_speed_kmh = total_distance / total_hours if total_hours > 0 else 0
-    sloth_speed_kmh = 0.24  # Three-toed sloth max speed (National Geographic)
-    usain_bolt_kmh = 44.72  # World record 100m pace (IAAF)
-    
-    # Time to cover your total distance at different speeds
-    sloth_hours = total_distance / sloth_speed_kmh if sloth_speed_kmh > 0 else 0
-    your_hours = total_hours
-    time_saved_vs_sloth = sloth_hours - your_hours
-    faster_than_sloth = sloth_hours / your_hours if your_hours > 0 else 0
-    percent_of_bolt = (avg_speed_kmh / usain_bolt_kmh * 100) if usain_bolt_kmh > 0 else 0
+    estimated_calories = total_distance * CALORIES_PER_KM
+    big_macs = estimated_calories / BIG_MAC_CALORIES
+    pizza_slices = estimated_calories / PIZZA_SLICE_CALORIES
+    beers = estimated_calories / BEER_CALORIES
+    
+    # Speed comparisons (based on distance traveled at avg speed). Your
+    # average speed and how much faster than a sloth you covered the distance
+    # share the hours denominator, so divide both at once; they stay 0 when no
+    # time was recorded
+    sloth_hours = total_distance / SLOTH_SPEED_KMH
+    avg_speed_kmh, faster_than_sloth = np.divide(
+        [total_distance, sloth_hours], total_hours,
+        out=np.zeros(2), where=total_hours > 0
+    )
+    percent_of_bolt = avg_speed_kmh / USAIN_BOLT_KMH * 100
     
     return {
         # Distance
@@ -209,13 +286,12 @@ def calculate_fun_metrics(df: pd.DataFrame) -> Dict[str, float]:
         >>> metrics = calculate_fun_metrics(df)
         >>> print(f"You've traveled {metrics['times_around_world']:.2f}x around Earth!")
     """
-    total_distance = df['Distance (km)'].sum()
-    total_elevation = df['Elevation (m)'].sum()
-    total_hours = df['Duration (min)'].sum() / 60
+    total_distance, total_elevation, total_minutes = _activity_totals(df)
+    total_hours = total_minutes / 60
     total_activities = len(df)
     
     # Calculate actual time span of activities
-    date_range = (df['Activity Date'].max() - df['Activity Date'].min()).days
+    date_range = _date_span_days(df['Activity Date'])
     actual_weeks = date_range / 7 if date_range > 0 else 1
     
     times_around_world = total_distance / EARTH_CIRCUMFERENCE_KM
@@ -269,38 +345,34 @@ def get_personal_records(df: pd.DataFrame) -> Dict[str, float]:
     
     # Use Moving Time for duration if available, otherwise fall back to Duration (min)
     if 'Moving Time' in df.columns:
-        # Create a copy with calculated speed from moving time
-        df_copy = df.copy()
-        df_copy['Calculated Speed'] = df_copy['Distance (km)'] / (df_copy['Moving Time'] / 3600)
-        
-        # Filter out unrealistically slow activities for each group
-        realistic_activities = []
-        for activity_group in df_copy['Activity Group'].unique():
-            group_df = df_copy[df_copy['Activity Group'] == activity_group]
-            min_speed = min_speeds.get(activity_group, 0.0)
-            
-            if min_speed > 0:
-                realistic = group_df[group_df['Calculated Speed'] >= min_speed]
-                realistic_activities.append(realistic)
-            else:
-                realistic_activities.append(group_df)
-        
-        if realistic_activities:
-            filtered_df = pd.concat(realistic_activities, ignore_index=True)
-            if len(filtered_df) > 0:
-                longest_duration = (filtered_df['Moving Time'] / 60).max()
-            else:
-                longest_duration = (df['Moving Time'] / 60).max()
+        moving_time = df['Moving Time'].to_numpy(dtype=np.float64)
+        moving_minutes = moving_time / 60
+        with np.errstate(divide='ignore', invalid='ignore'):
+            calculated_speed = df['Distance (km)'].to_numpy(dtype=np.float64) / (moving_time / 3600)
+        
+        # Filter out unrealistically slow activities for each group in one
+        # mask; activities without a group are left out
+        groups = df['Activity Group']
+        if isinstance(groups.dtype, pd.CategoricalDtype):
+            # Look the minimum up once per category and gather it by code
+            per_category = np.array([min_speeds.get(group, 0.0) for group in groups.cat.categories] + [0.0])
+            min_speed = per_category[groups.cat.codes.to_numpy()]
         else:
-            longest_duration = (df['Moving Time'] / 60).max()
+            min_speed = groups.map(min_speeds).astype(float).fillna(0.0).to_numpy()
+        realistic = groups.notna().to_numpy() & ((min_speed <= 0) | (calculated_speed >= min_speed))
+        
+        if realistic.any():
+            longest_duration = _nanmax(moving_minutes[realistic])
+        else:
+            longest_duration = _nanmax(moving_minutes)
     else:
-        longest_duration = df["Duration (min)"].max()
+        longest_duration = _nanmax(df["Duration (min)"].to_numpy(dtype=np.float64))
     
     return {
-        'longest_distance': df["Distance (km)"].max(),
+        'longest_distance': _nanmax(df["Distance (km)"].to_numpy(dtype=np.float64)),
         'longest_duration': longest_duration,
-        'most_elevation': df["Elevation (m)"].max(),
-        'fastest_speed': df["Average Speed (km/h)"].max()
+        'most_elevation': _nanmax(df["Elevation (m)"].to_numpy(dtype=np.float64)),
+        'fastest_speed': _nanmax(df["Average Speed (km/h)"].to_numpy(dtype=np.float64))
     }
 
 
@@ -321,14 +393,53 @@ def calculate_summary_stats(df: pd.DataFrame) -> Dict[str, float]:
         >>> stats = calculate_summary_stats(recent_df)
         >>> print(f"Total: {stats['total_distance']:.1f} km")
     """
+    total_distance, total_elevation, total_minutes = _activity_totals(df)
+    
     return {
         'total_activities': len(df),
-        'total_distance': df['Distance (km)'].sum(),
-        'total_duration': df['Duration (min)'].sum() / 60,
-        'total_elevation': df['Elevation (m)'].sum()
+        'total_distance': total_distance,
+        'total_duration': total_minutes / 60,
+        'total_elevation': total_elevation
     }
 
 
+# Help texts that only depend on constants are built once
+_EARTH_HELP = f"Based on {EARTH_CIRCUMFERENCE_KM:,} km circumference"
+_EARTH_PROGRESS_HELP = f"Progress towards {EARTH_CIRCUMFERENCE_KM:,} km"
+_EVEREST_HELP = f"Based on Everest's {EVEREST_HEIGHT_M:,}m height"
+_EVEREST_PROGRESS_HELP = f"Progress towards {EVEREST_HEIGHT_M:,}m"
+
+
+def _format_earth(value: float) -> Tuple[str, str]:
+    """Format a times-around-Earth value for format_metric_display."""
+    if value >= 1:
+        return f"{value:.2f}x", _EARTH_HELP
+    return f"{value * 100:.1f}%", _EARTH_PROGRESS_HELP
+
+
+def _format_everest(value: float) -> Tuple[str, str]:
+    """Format a times-up-Everest value for format_metric_display."""
+    if value >= 1:
+        return f"{value:.1f}x", _EVEREST_HELP
+    return f"{value * 100:.0f}%", _EVEREST_PROGRESS_HELP
+
+
+def _format_time(value: float) -> Tuple[str, str]:
+    """Format a days-active value for format_metric_display."""
+    help_text = f"That's {int(value * 24):,} hours of activity!"
+    if value >= 365:
+        return f"{value / 365:.1f} years", help_text
+    return f"{int(value)} days", help_text
+
+
+# Formatter for each format_metric_display metric type
+_METRIC_FORMATTERS = {
+    'earth': _format_earth,
+    'everest': _format_everest,
+    'time': _format_time,
+}
+
+
 def format_metric_display(value: float, metric_type: str) -> Tuple[str, str]:
     """Format metrics for display with appropriate units and thresholds.
     
@@ -343,30 +454,93 @@ def format_metric_display(value: float, metric_type: str) -> Tuple[str, str]:
         >>> display, help_text = format_metric_display(1.5, 'earth')
         >>> print(display)  # "1.50x"
     """
-    if metric_type == 'earth':
-        if value >= 1:
-            return f"{value:.2f}x", f"Based on {EARTH_CIRCUMFERENCE_KM:,} km circumference"
-        else:
-            percentage = value * 100
-            return f"{percentage:.1f}%", f"Progress towards {EARTH_CIRCUMFERENCE_KM:,} km"
-            
-    elif metric_type == 'everest':
-        if value >= 1:
-            return f"{value:.1f}x", f"Based on Everest's {EVEREST_HEIGHT_M:,}m height"
-        else:
-            percentage = value * 100
-            return f"{percentage:.0f}%", f"Progress towards {EVEREST_HEIGHT_M:,}m"
-            
-    elif metric_type == 'time':
-        if value >= 365:
-            years = value / 365
-            total_hours = int(value * 24)
-            return f"{years:.1f} years", f"That's {total_hours:,} hours of activity!"
-        else:
-            total_hours = int(value * 24)
-            return f"{int(value)} days", f"That's {total_hours:,} hours of activity!"
-            
-    return str(value), ""
+    formatter = _METRIC_FORMATTERS.get(metric_type)
+    if formatter is None:
+        return str(value), ""
+    return formatter(value)
+
+
+# Race detection keywords, kept as module-level tuples so they are built once
+# rather than on every is_race call
+
+# Highest priority anti-patterns - these override everything
+_RACE_PRIORITY_ANTI_PATTERNS = (
+    "1/3 marathon",
+    "almost half marathon",
+    "almost marathon",
+    "almost half",
+    "pre race",
+    "post race",
+    "worth missing parkrun",
+    "missing parkrun",
+    "skip parkrun",
+    "skipped parkrun",
+    "race across world",
+    "featured in race",
+    "half ben nevis",
+    "halfway",
+)
+
+# Strong race indicators - these are unambiguous race terms
+_RACE_STRONG_KEYWORDS = (
+    "parkrun",
+    "park run",
+    "half marathon",
+    "marathon",
+    "ultra marathon",
+    "triathlon",
+    "duathlon",
+    "ironman",
+    "10k race",
+    "5k race",
+    "championship",
+    "championships",
+    "competition",
+    " xc ",  # cross country with spaces to avoid matching "exercise"
+    "xc race",
+    "xc run",
+)
+
+# Anti-patterns for weaker keywords (route, training, recovery)
+_RACE_WEAK_ANTI_PATTERNS = (
+    "route",  # "marathon route bike ride"
+    "training",  # "race training", "10k training"
+    "recovery",  # "recovery 10k"
+    "too long 10k",  # sarcastic name
+)
+
+# Medium strength distance references, only checked in the activity name
+_RACE_MEDIUM_KEYWORDS = (
+    "10k",
+    "5k",
+    "10km",
+    "5km",
+    "10,000",
+    "5,000",
+)
+
+
+def _keyword_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    """Compile keywords into a single literal alternation.
+    
+    A text is then scanned once for all of the keywords, in C, instead of
+    once per keyword from Python.
+    """
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+_RACE_PRIORITY_ANTI_RE = _keyword_pattern(_RACE_PRIORITY_ANTI_PATTERNS)
+_RACE_STRONG_RE = _keyword_pattern(_RACE_STRONG_KEYWORDS)
+_RACE_WEAK_ANTI_RE = _keyword_pattern(_RACE_WEAK_ANTI_PATTERNS)
+_RACE_MEDIUM_RE = _keyword_pattern(_RACE_MEDIUM_KEYWORDS)
+
+# "XC" (cross country) as a whole word
+_RACE_XC_RE = re.compile(r'\bxc\b')
+
+# Text dtype for the vectorized race keyword scans. pandas 3's default str
+# dtype is already Arrow-backed; on 2.x ask for Arrow strings explicitly so the
+# scans run on Arrow kernels rather than a Python call per object
+_RACE_TEXT_DTYPE = str if int(pd.__version__.split(".")[0]) >= 3 else pd.StringDtype("pyarrow")
 
 
 def is_race(activity_name: str, activity_description: str = "") -> bool:
@@ -397,94 +571,43 @@ def is_race(activity_name: str, activity_description: str = "") -> bool:
     if activity_description == "nan":
         activity_description = ""
     
-    name_lower = activity_name.lower()
-    desc_lower = activity_description.lower()
+    return _is_race_text(activity_name.lower(), activity_description.lower())
+
+
+@lru_cache(maxsize=2048)
+def _is_race_text(name_lower: str, desc_lower: str) -> bool:
+    """Keyword scan behind is_race, memoized on the lower-cased name/description.
+    
+    Activity names are heavily repeated ("Morning Run", "Lunch Ride"), so
+    caching the result skips the keyword scan for every duplicate. Callers
+    lower-case the text first, so batch callers can do it once per column.
+    """
     combined = (name_lower + " " + desc_lower).strip()
     
     # Check highest priority anti-patterns first (before any keyword matching)
     # These override everything
-    priority_anti_patterns = [
-        "1/3 marathon",
-        "almost half marathon",
-        "almost marathon",
-        "almost half",
-        "pre race",
-        "post race",
-        "worth missing parkrun",
-        "missing parkrun",
-        "skip parkrun",
-        "skipped parkrun",
-        "race across world",
-        "featured in race",
-        "half ben nevis",
-        "halfway",
-    ]
+    if _RACE_PRIORITY_ANTI_RE.search(combined):
+        return False
     
-    for pattern in priority_anti_patterns:
-        if pattern in combined:
-            return False
-    
-    # Strong race indicators
-    # These are unambiguous race terms
-    strong_keywords = [
-        "parkrun",
-        "park run",
-        "half marathon",
-        "marathon",
-        "ultra marathon",
-        "triathlon",
-        "duathlon",
-        "ironman",
-        "10k race",
-        "5k race",
-        "championship",
-        "championships",
-        "competition",
-        " xc ",  # cross country with spaces to avoid matching "exercise"
-        "xc race",
-        "xc run",
-    ]
-    
-    # Check for strong keywords in name or description
-    for keyword in strong_keywords:
-        if keyword in name_lower or keyword in desc_lower:
-            return True
-    
-    # Anti-patterns for weaker keywords (route, training, recovery)
-    weak_anti_patterns = [
-        "route",  # "marathon route bike ride"
-        "training",  # "race training", "10k training"
-        "recovery",  # "recovery 10k"
-        "too long 10k",  # sarcastic name
-    ]
+    # Check for strong keywords in name or description with a single scan;
+    # no keyword contains the \x1f separator, so a match can't span both
+    if _RACE_STRONG_RE.search(f"{name_lower}\x1f{desc_lower}"):
+        return True
     
     # Check weak anti-patterns
-    for pattern in weak_anti_patterns:
-        if pattern in combined:
-            return False
+    if _RACE_WEAK_ANTI_RE.search(combined):
+        return False
     
     # Special handling for "XC" (cross country) - match if it's a word boundary
-    import re
-    if re.search(r'\bxc\b', name_lower):
+    if _RACE_XC_RE.search(name_lower):
         return True
     
-    # Medium strength - check name first, then description
+    # Medium strength - check if a distance reference is in the name
     # Format: "City Name Half" or "City Name 10k"
-    medium_keywords = [
-        "10k",
-        "5k",
-        "10km",
-        "5km",
-        "10,000",
-        "5,000",
-    ]
-    
-    for keyword in medium_keywords:
-        # Check if keyword is in name as a standalone distance reference
-        if keyword in name_lower:
-            # Make sure it's not part of a longer phrase that's not a race
-            if "route" not in name_lower and "training" not in name_lower:
-                return True
+    if _RACE_MEDIUM_RE.search(name_lower):
+        # Make sure it's not part of a longer phrase that's not a race
+        if "route" not in name_lower and "training" not in name_lower:
+            return True
     
     # Weak indicator - "race" keyword needs more context
     # Check in name first, then description
@@ -513,6 +636,55 @@ def is_race(activity_name: str, activity_description: str = "") -> bool:
     return False
 
 
+def get_race_mask(df: pd.DataFrame) -> pd.Series:
+    """Determine which activities are races, for a whole DataFrame at once.
+    
+    Applies the same keyword tiers as is_race, but each tier is one
+    vectorized string scan over the Activity Name and Activity Description
+    columns instead of a Python call per activity.
+    
+    Args:
+        df: DataFrame containing activity data. Missing 'Activity Name' or
+            'Activity Description' columns are treated as empty.
+        
+    Returns:
+        Boolean Series aligned with df, True for likely races.
+        
+    Examples:
+        >>> races_only = df[get_race_mask(df)]
+    """
+    empty = pd.Series("", index=df.index, dtype=object)
+    name_lower = df.get('Activity Name', empty).fillna("").astype(_RACE_TEXT_DTYPE).str.lower()
+    desc_lower = df.get('Activity Description', empty).fillna("").astype(_RACE_TEXT_DTYPE).str.lower()
+    combined = (name_lower + " " + desc_lower).str.strip()
+    
+    def matches(text: pd.Series, pattern: re.Pattern) -> np.ndarray:
+        return text.str.contains(pattern.pattern, regex=True).to_numpy(dtype=bool)
+    
+    def has(text: pd.Series, keyword: str) -> np.ndarray:
+        return text.str.contains(keyword, regex=False).to_numpy(dtype=bool)
+    
+    priority_anti = matches(combined, _RACE_PRIORITY_ANTI_RE)
+    strong = matches(name_lower + "\x1f" + desc_lower, _RACE_STRONG_RE)
+    weak_anti = matches(combined, _RACE_WEAK_ANTI_RE)
+    
+    # "xc" is rare, so the whole-word check only runs on names containing it
+    xc = has(name_lower, "xc").copy()
+    xc[xc] = [_RACE_XC_RE.search(name) is not None for name in name_lower[xc]]
+    
+    # is_race's "route"/"training" exclusions for these tiers are already
+    # covered by the weak anti-patterns, so they aren't scanned again
+    medium = matches(name_lower, _RACE_MEDIUM_RE)
+    race_in_name = has(name_lower, "race") & ~has(name_lower, "race across")
+    race_in_desc = has(desc_lower, "race") & ~has(desc_lower, "race across")
+    half = ((has(name_lower, " half") | name_lower.str.endswith("half").to_numpy(dtype=bool))
+            & ~has(name_lower, "ben nevis") & ~has(name_lower, "way"))
+    relay = has(name_lower, "relay")
+    
+    weak = xc | medium | race_in_name | race_in_desc | half | relay
+    return pd.Series(~priority_anti & (strong | (~weak_anti & weak)), index=df.index)
+
+
 def format_race_time(seconds: float) -> str:
     """Format time in seconds to HH:MM:SS or MM:SS format.
     
@@ -528,9 +700,8 @@ def format_race_time(seconds: float) -> str:
         >>> format_race_time(125)
         '2:05'
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    hours, rest = divmod(int(seconds // 1), 3600)
+    minutes, secs = divmod(rest, 60)
     
     if hours > 0:
         return f"{hours}:{minutes:02d}:{secs:02d}"
@@ -538,6 +709,36 @@ def format_race_time(seconds: float) -> str:
         return f"{minutes}:{secs:02d}"
 
 
+def format_race_times(seconds: pd.Series) -> pd.Series:
+    """Format a Series of times in seconds like format_race_time.
+    
+    The hour/minute/second split is done with NumPy integer arithmetic over
+    the whole Series, leaving only the string formatting per value.
+    
+    Args:
+        seconds: Series of times in seconds.
+        
+    Returns:
+        Series of formatted time strings aligned with `seconds`, with "N/A"
+        for missing times.
+        
+    Examples:
+        >>> format_race_times(pd.Series([3661, 125])).tolist()
+        ['1:01:01', '2:05']
+    """
+    values = seconds.to_numpy(dtype=np.float64, na_value=np.nan)
+    has_time = np.isfinite(values)
+    whole_seconds = np.floor(np.where(has_time, values, 0)).astype(np.int64)
+    hours, rest = np.divmod(whole_seconds, 3600)
+    minutes, secs = np.divmod(rest, 60)
+    
+    formatted = [
+        (f"{h}:{m:02d}:{s:02d}" if h > 0 else f"{m}:{s:02d}") if valid else "N/A"
+        for h, m, s, valid in zip(hours.tolist(), minutes.tolist(), secs.tolist(), has_time.tolist())
+    ]
+    return pd.Series(formatted, index=seconds.index)
+
+
 def get_best_race_times(df: pd.DataFrame) -> Dict[str, any]:
     """Get best race times for standard distances (5k, 10k, half marathon, marathon).
     
@@ -549,13 +750,11 @@ def get_best_race_times(df: pd.DataFrame) -> Dict[str, any]:
         and dates, or None if no races found for that distance.
     """
     # Filter to running activities only
-    running_df = df[df['Activity Group'] == 'Running'].copy()
+    running_df = df[df['Activity Group'] == 'Running']
     
     if len(running_df) == 0:
         return {'5k': None, '10k': None, 'half': None, 'marathon': None}
     
-    results = {}
-    
     # Define distance ranges (in km) for each race type
     # Allow small tolerance for GPS inaccuracy
     distance_ranges = {
@@ -565,30 +764,34 @@ def get_best_race_times(df: pd.DataFrame) -> Dict[str, any]:
         'marathon': (41.5, 43.0)  # Marathon (42.2km)
     }
     
-    for race_type, (min_dist, max_dist) in distance_ranges.items():
-        # Filter to activities in this distance range
-        candidates = running_df[
-            (running_df['Distance (km)'] >= min_dist) & 
-            (running_df['Distance (km)'] <= max_dist)
-        ].copy()
-        
-        if len(candidates) > 0:
-            # Get the fastest (minimum time)
-            # Use Elapsed Time if available, otherwise use Time
-            time_col = 'Elapsed Time' if 'Elapsed Time' in candidates.columns else 'Time'
-            if time_col in candidates.columns:
-                fastest_idx = candidates[time_col].idxmin()
-                fastest = candidates.loc[fastest_idx]
-                
-                results[race_type] = {
-                    'time': fastest[time_col],
-                    'time_formatted': format_race_time(fastest[time_col]),
-                    'distance': fastest['Distance (km)'],
-                    'date': fastest['Activity Date'],
-                    'name': fastest.get('Activity Name', 'Unknown')
-                }
-            else:
-                results[race_type] = None
+    # Use Elapsed Time if available, otherwise use Time
+    time_col = 'Elapsed Time' if 'Elapsed Time' in running_df.columns else 'Time'
+    if time_col not in running_df.columns:
+        return {race_type: None for race_type in distance_ranges}
+    
+    # Assign each activity to the race type whose range contains its distance
+    # (the ranges don't overlap), then find every fastest time in one groupby
+    min_dists, max_dists = (np.array(bounds) for bounds in zip(*distance_ranges.values()))
+    distances = running_df['Distance (km)'].to_numpy()
+    race_bin = np.searchsorted(min_dists, distances, side='right') - 1
+    in_range = (race_bin >= 0) & (distances <= max_dists[np.maximum(race_bin, 0)])
+    race_times = running_df[time_col][in_range]
+    race_bin = pd.Series(race_bin[in_range], index=race_times.index)
+    has_time = race_times.notna()
+    fastest_idx = race_times[has_time].groupby(race_bin[has_time]).idxmin()
+    
+    results = {}
+    for race_bin_code, race_type in enumerate(distance_ranges):
+        if race_bin_code in fastest_idx.index:
+            fastest = running_df.loc[fastest_idx[race_bin_code]]
+            
+            results[race_type] = {
+                'time': fastest[time_col],
+                'time_formatted': format_race_time(fastest[time_col]),
+                'distance': fastest['Distance (km)'],
+                'date': fastest['Activity Date'],
+                'name': fastest.get('Activity Name', 'Unknown')
+            }
         else:
             results[race_type] = None
     
@@ -610,21 +813,9 @@ def get_races(df: pd.DataFrame) -> pd.DataFrame:
         >>> print(races.columns)
         Index(['Race Name', 'Date', 'Distance (km)', 'Time', 'Activity Type'], dtype='object')
     """
-    # Filter to races only
-    df_copy = df.copy()
-    
-    # Handle missing descriptions
-    if 'Activity Description' not in df_copy.columns:
-        df_copy['Activity Description'] = ""
-    df_copy['Activity Description'] = df_copy['Activity Description'].fillna("")
-    
-    # Apply race detection
-    df_copy['Is Race'] = df_copy.apply(
-        lambda row: is_race(row.get('Activity Name', ''), row.get('Activity Description', '')),
-        axis=1
-    )
-    
-    races_df = df_copy[df_copy['Is Race']].copy()
+    # Filter to races only; get_race_mask treats a missing description as
+    # empty, so the frame is sliced rather than copied
+    races_df = df[get_race_mask(df)]
     
     if len(races_df) == 0:
         # Return empty DataFrame with correct columns
@@ -632,18 +823,18 @@ def get_races(df: pd.DataFrame) -> pd.DataFrame:
     
     # Format the time from seconds
     if 'Elapsed Time' in races_df.columns:
-        races_df['Time'] = races_df['Elapsed Time'].apply(format_race_time)
+        race_times = format_race_times(races_df['Elapsed Time'])
     elif 'Time' in races_df.columns:
-        races_df['Time'] = races_df['Time'].apply(format_race_time)
+        race_times = format_race_times(races_df['Time'])
     else:
-        races_df['Time'] = "N/A"
+        race_times = "N/A"
     
     # Create display DataFrame
     result = pd.DataFrame({
         'Race Name': races_df['Activity Name'],
         'Date': races_df['Activity Date'],
         'Distance (km)': races_df['Distance (km)'],
-        'Time': races_df['Time'],
+        'Time': race_times,
         'Activity Type': races_df['Activity Type']
     })
     
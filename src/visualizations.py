@@ -4,12 +4,48 @@ This module contains all Plotly-based visualization functions used to
 display activity data in various chart formats.
 """
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
-from src.config import ACTIVITY_COLORS
+from src.config import ACTIVITY_COLORS, PLOTLY_LIGHT_THEME
+from src.data_loader import count_values
+
+# Figure serialization needs no engine setting here: plotly.io's JSON engine
+# defaults to "auto", which already picks orjson whenever it is installed.
+
+
+@lru_cache(maxsize=None)
+def _layout_for_theme(theme_items: Tuple[Tuple[str, str], ...]) -> dict:
+    """Build the shared chart layout for one theme; see _themed_layout."""
+    theme = dict(theme_items)
+    return {
+        "plot_bgcolor": theme['plot_bgcolor'],
+        "paper_bgcolor": theme['paper_bgcolor'],
+        "font": {"family": "Arial, sans-serif", "size": 12, "color": theme['font_color']},
+        "title": {"font": {"size": 16, "color": theme['title_color']}},
+        "xaxis": {"showgrid": True, "gridcolor": theme['grid_color'], "zeroline": False},
+        "yaxis": {"showgrid": True, "gridcolor": theme['grid_color'], "zeroline": False},
+    }
+
+
+def _themed_layout(theme: dict) -> dict:
+    """Get the background, font, title and grid layout shared by the charts.
+    
+    The layout is built once per theme and reused, so callers pass it to
+    update_layout and must not modify it. Keyword arguments given alongside
+    it to update_layout are merged on top.
+    
+    Args:
+        theme: Dict containing theme colors, e.g. PLOTLY_LIGHT_THEME.
+        
+    Returns:
+        Layout dict in full (non-shorthand) form.
+    """
+    return _layout_for_theme(tuple(theme.items()))
 
 
 def create_exercise_obsession_gauge(score: int, level: str, theme: dict = None) -> go.Figure:
@@ -94,14 +130,7 @@ def create_distance_timeline(df: pd.DataFrame, title: str = "Distance Per Activi
         line_color='#12436D',  # UK Gov dark blue
         marker=dict(size=6, line=dict(width=1, color='white'))
     )
-    fig.update_layout(
-        plot_bgcolor=theme['plot_bgcolor'],
-        paper_bgcolor=theme['paper_bgcolor'],
-        font=dict(family="Arial, sans-serif", size=12, color=theme['font_color']),
-        title_font=dict(size=16, color=theme['title_color']),
-        xaxis=dict(showgrid=True, gridcolor=theme['grid_color'], zeroline=False),
-        yaxis=dict(showgrid=True, gridcolor=theme['grid_color'], zeroline=False)
-    )
+    fig.update_layout(_themed_layout(theme))
     return fig
 
 
@@ -119,15 +148,19 @@ def create_activity_type_pie(df: pd.DataFrame, title: str = "Activities by Type"
         >>> fig = create_activity_type_pie(df)
         >>> st.plotly_chart(fig)
     """
-    activity_counts = df["Activity Group"].value_counts()
+    # Only groups with activities, most common first; count_values keeps tied
+    # groups in the order they first appear, as the Altair pie does
+    activity_counts = count_values(df["Activity Group"])
     
-    fig = px.pie(
-        values=activity_counts.values,
-        names=activity_counts.index,
-        title=title,
-        color=activity_counts.index,
-        color_discrete_map=ACTIVITY_COLORS
-    )
+    # A single pie trace built directly skips px.pie's DataFrame rebuild.
+    # sort=False keeps that slice order instead of Plotly re-sorting ties.
+    fig = go.Figure(go.Pie(
+        labels=list(activity_counts),
+        values=list(activity_counts.values()),
+        marker=dict(colors=[ACTIVITY_COLORS.get(group) for group in activity_counts]),
+        sort=False
+    ))
+    fig.update_layout(title=dict(text=title))
     return fig
 
 
@@ -152,27 +185,18 @@ def create_duration_histogram(df: pd.DataFrame, title: str = "Duration Distribut
     if theme is None:
         theme = PLOTLY_LIGHT_THEME
     # Create bins for smoother distribution
-    fig = go.Figure()
-    
-    fig.add_trace(go.Histogram(
-        x=df["Duration (min)"],
+    fig = go.Figure(go.Histogram(
+        x=df["Duration (min)"].to_numpy(),
         nbinsx=nbins,
-        marker_color='#12436D',  # UK Gov dark blue
-        marker_line_color='white',
-        marker_line_width=1,
+        marker=dict(color='#12436D', line=dict(color='white', width=1)),  # UK Gov dark blue
         opacity=0.85
     ))
     
     fig.update_layout(
-        title=title,
-        xaxis_title="Duration (min)",
-        yaxis_title="Count",
-        plot_bgcolor=theme['plot_bgcolor'],
-        paper_bgcolor=theme['paper_bgcolor'],
-        font=dict(family="Arial, sans-serif", size=12, color=theme['font_color']),
-        title_font=dict(size=16, color=theme['title_color']),
-        xaxis=dict(showgrid=True, gridcolor=theme['grid_color'], zeroline=False),
-        yaxis=dict(showgrid=True, gridcolor=theme['grid_color'], zeroline=False),
+        _themed_layout(theme),
+        title=dict(text=title),
+        xaxis=dict(title=dict(text="Duration (min)")),
+        yaxis=dict(title=dict(text="Count")),
         bargap=0.05
     )
     return fig
@@ -218,14 +242,7 @@ def create_cumulative_distance_chart(period_data: pd.DataFrame,
         marker=dict(size=8, line=dict(width=1, color='white')),
         line_width=3
     )
-    fig.update_layout(
-        plot_bgcolor=theme['plot_bgcolor'],
-        paper_bgcolor=theme['paper_bgcolor'],
-        font=dict(family="Arial, sans-serif", size=12, color=theme['font_color']),
-        title_font=dict(size=16, color=theme['title_color']),
-        xaxis=dict(showgrid=True, gridcolor=theme['grid_color'], zeroline=False),
-        yaxis=dict(showgrid=True, gridcolor=theme['grid_color'], zeroline=False)
-    )
+    fig.update_layout(_themed_layout(theme))
     
     # Adjust tick frequency based on interval
     if interval == "quarterly":
@@ -266,44 +283,34 @@ def create_quarterly_trends_chart(period_data: pd.DataFrame,
         return None
         
     # Create figure with secondary y-axis
-    fig = go.Figure()
-    
-    # Add Distance trace on primary y-axis
-    fig.add_trace(go.Scatter(
-        x=period_data["Period"],
-        y=period_data["Distance"],
-        name="Distance (km)",
-        mode='lines+markers',
-        line=dict(color='#12436D', width=2.5),
-        marker=dict(size=7, line=dict(width=1, color='white'))
-    ))
-    
-    # Add Activity Count trace on secondary y-axis
-    fig.add_trace(go.Scatter(
-        x=period_data["Period"],
-        y=period_data["Activity Count"],
-        name="Activity Count",
-        mode='lines+markers',
-        line=dict(color='#F46A25', width=2.5),
-        marker=dict(size=7, line=dict(width=1, color='white')),
-        yaxis="y2"
-    ))
+    fig = go.Figure([
+        # Distance trace on primary y-axis
+        go.Scatter(
+            x=period_data["Period"],
+            y=period_data["Distance"],
+            name="Distance (km)",
+            mode='lines+markers',
+            line=dict(color='#12436D', width=2.5),
+            marker=dict(size=7, line=dict(width=1, color='white'))
+        ),
+        # Activity Count trace on secondary y-axis
+        go.Scatter(
+            x=period_data["Period"],
+            y=period_data["Activity Count"],
+            name="Activity Count",
+            mode='lines+markers',
+            line=dict(color='#F46A25', width=2.5),
+            marker=dict(size=7, line=dict(width=1, color='white')),
+            yaxis="y2"
+        )
+    ])
     
     fig.update_layout(
-        title=title,
-        plot_bgcolor=theme['plot_bgcolor'],
-        paper_bgcolor=theme['paper_bgcolor'],
-        font=dict(family="Arial, sans-serif", size=12, color=theme['font_color']),
-        title_font=dict(size=16, color=theme['title_color']),
-        xaxis=dict(showgrid=True, gridcolor=theme['grid_color'], zeroline=False),
-        yaxis=dict(
-            title="Distance (km)",
-            showgrid=True, 
-            gridcolor=theme['grid_color'], 
-            zeroline=False
-        ),
+        _themed_layout(theme),
+        title=dict(text=title),
+        yaxis=dict(title=dict(text="Distance (km)")),
         yaxis2=dict(
-            title="Activity Count",
+            title=dict(text="Activity Count"),
             overlaying="y",
             side="right",
             showgrid=False,
@@ -375,12 +382,8 @@ def create_stacked_activity_chart(activity_data: pd.DataFrame,
         fig.update_xaxes(tickangle=0, dtick=1)  # Show every year
         
     fig.update_layout(
-        plot_bgcolor=theme['plot_bgcolor'],
-        paper_bgcolor=theme['paper_bgcolor'],
-        font=dict(family="Arial, sans-serif", size=12, color=theme['font_color']),
-        title_font=dict(size=16, color=theme['title_color']),
-        xaxis=dict(showgrid=False, zeroline=False),
-        yaxis=dict(showgrid=True, gridcolor=theme['grid_color'], zeroline=False),
+        _themed_layout(theme),
+        xaxis=dict(showgrid=False),
         hovermode="x unified",
         legend=dict(
             title="Activity Type",
@@ -421,14 +424,7 @@ def create_rolling_average_chart(monthly_data: pd.DataFrame,
         marker=dict(size=7, line=dict(width=1, color='white')),
         line_width=3
     )
-    fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Arial, sans-serif", size=12, color="#2c3e50"),
-        title_font=dict(size=16, color="#2c3e50"),
-        xaxis=dict(showgrid=True, gridcolor='#f0f0f0', zeroline=False),
-        yaxis=dict(showgrid=True, gridcolor='#f0f0f0', zeroline=False)
-    )
+    fig.update_layout(_themed_layout(PLOTLY_LIGHT_THEME))
     fig.update_xaxes(tickangle=0, dtick=4)  # Show every 4 quarters (yearly)
     return fig
 
@@ -448,17 +444,20 @@ def create_year_over_year_chart(df: pd.DataFrame,
         >>> fig = create_year_over_year_chart(df)
         >>> st.plotly_chart(fig)
     """
-    df_timeline = df.copy()
-    df_timeline["Year"] = df_timeline["Activity Date"].dt.year
-    df_timeline["Month"] = df_timeline["Activity Date"].dt.month
+    # Group on a single integer key per calendar month (months since 1970-01)
+    # instead of a two-level year/month groupby, then split it back into
+    # year and month for the chart
+    dates = df["Activity Date"].to_numpy()
+    valid = ~np.isnat(dates)
+    month_keys = dates[valid].astype("datetime64[M]").astype(np.int64)
+    totals = df["Distance (km)"][valid].groupby(month_keys).sum()
     
-    yearly_monthly = df_timeline.groupby(["Year", "Month"]).agg({
-        "Distance (km)": "sum"
-    }).reset_index()
-    yearly_monthly["Month Name"] = pd.to_datetime(
-        yearly_monthly["Month"], format='%m'
-    ).dt.month_name()
-    yearly_monthly["Year"] = yearly_monthly["Year"].astype(str)
+    month_keys = totals.index.to_numpy()
+    yearly_monthly = pd.DataFrame({
+        "Year": (month_keys // 12 + 1970).astype(str),
+        "Month": month_keys % 12 + 1,
+        "Distance (km)": totals.to_numpy()
+    })
     
     fig = px.line(
         yearly_monthly,
@@ -507,14 +506,7 @@ def create_quarterly_bar_chart(quarterly_stats: pd.DataFrame,
         textposition='outside',
         texttemplate='%{text:.1f}'
     )
-    fig.update_layout(
-        plot_bgcolor=theme['plot_bgcolor'],
-        paper_bgcolor=theme['paper_bgcolor'],
-        font=dict(family="Arial, sans-serif", size=12, color=theme['font_color']),
-        title_font=dict(size=16, color=theme['title_color']),
-        xaxis=dict(showgrid=False, zeroline=False),
-        yaxis=dict(showgrid=True, gridcolor=theme['grid_color'], zeroline=False)
-    )
+    fig.update_layout(_themed_layout(theme), xaxis=dict(showgrid=False))
     return fig
 
 
@@ -537,7 +529,7 @@ def create_activity_heatmap(df: pd.DataFrame, current_year: int,
     if title is None:
         title = f"Activity Heatmap - {current_year}"
     
-    df_year = df[df["Activity Date"].dt.year == current_year].copy()
+    df_year = df[df["Activity Date"].dt.year == current_year]
     
     fig = px.density_heatmap(
         df_year,
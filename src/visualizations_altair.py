@@ -5,10 +5,12 @@ display activity data in various chart formats with better mobile support.
 """
 
 import altair as alt
+import numpy as np
 import pandas as pd
 from typing import Optional, Dict
 
 from src.config import ACTIVITY_COLORS
+from src.data_loader import count_values, get_period_categories
 
 # Configure Altair for better mobile rendering
 alt.data_transformers.disable_max_rows()
@@ -60,7 +62,7 @@ def create_distance_timeline(df: pd.DataFrame, title: str = "Distance Per Activi
     """
     t = get_altair_theme(theme)
     
-    df_sorted = df.sort_values("Activity Date").copy()
+    df_sorted = df.sort_values("Activity Date")
     
     base = alt.Chart(df_sorted).encode(
         x=alt.X('Activity Date:T', title='Date', axis=alt.Axis(format='%b %d')),
@@ -102,8 +104,9 @@ def create_activity_type_pie(df: pd.DataFrame, title: str = "Activities by Type"
     """
     t = get_altair_theme(theme)
     
-    activity_counts = df["Activity Group"].value_counts().reset_index()
-    activity_counts.columns = ["Activity Group", "Count"]
+    activity_counts = pd.DataFrame(
+        count_values(df["Activity Group"]).items(), columns=["Activity Group", "Count"]
+    )
     
     # Create color domain and range from ACTIVITY_COLORS
     color_domain = list(ACTIVITY_COLORS.keys())
@@ -188,7 +191,7 @@ def create_cumulative_distance_chart(period_data: pd.DataFrame,
         return None
     
     base = alt.Chart(period_data).encode(
-        x=alt.X('Period:N', title='Period', axis=alt.Axis(labelAngle=0)),
+        x=alt.X('Period:N', title='Period', sort=None, axis=alt.Axis(labelAngle=0)),
         y=alt.Y('Cumulative Distance:Q', title='Total Distance (km)')
     )
     
@@ -235,7 +238,7 @@ def create_activity_trends_chart(period_data: pd.DataFrame,
     
     # Create base encoding
     base = alt.Chart(period_data).encode(
-        x=alt.X('Period:N', title='Period', axis=alt.Axis(labelAngle=0))
+        x=alt.X('Period:N', title='Period', sort=None, axis=alt.Axis(labelAngle=0))
     )
     
     # Distance line (left axis)
@@ -308,7 +311,7 @@ def create_stacked_activity_chart(activity_data: pd.DataFrame,
     color_range = list(ACTIVITY_COLORS.values())
     
     chart = alt.Chart(activity_data).mark_bar().encode(
-        x=alt.X('Period:N', title='Period', axis=alt.Axis(labelAngle=0)),
+        x=alt.X('Period:N', title='Period', sort=None, axis=alt.Axis(labelAngle=0)),
         y=alt.Y('Count:Q', title='Number of Activities', stack='zero'),
         color=alt.Color('Activity Group:N',
                        scale=alt.Scale(domain=color_domain, range=color_range),
@@ -354,9 +357,10 @@ def create_activity_heatmap(df: pd.DataFrame, current_year: int,
     if title is None:
         title = f"Activity Heatmap - {current_year}"
     
-    df_year = df[df["Activity Date"].dt.year == current_year].copy()
-    df_year["Week"] = df_year["Activity Date"].dt.isocalendar().week.astype(int)
-    df_year["DayNum"] = df_year["Activity Date"].dt.dayofweek  # 0=Monday, 6=Sunday
+    dates = df["Activity Date"]
+    dates = dates[dates.dt.year == current_year]
+    week = dates.dt.isocalendar().week.astype(int).rename("Week")
+    day_num = dates.dt.dayofweek.rename("DayNum")  # 0=Monday, 6=Sunday
     
     # Create complete grid of all weeks and days
     all_weeks = list(range(1, 54))
@@ -368,7 +372,7 @@ def create_activity_heatmap(df: pd.DataFrame, current_year: int,
                              columns=["Week", "DayNum"])
     
     # Aggregate actual activity data
-    activity_counts = df_year.groupby(["Week", "DayNum"]).size().reset_index(name="Count")
+    activity_counts = dates.groupby([week, day_num]).size().reset_index(name="Count")
     
     # Merge to get full grid with counts (0 for empty days)
     heatmap_data = full_grid.merge(activity_counts, on=["Week", "DayNum"], how="left")
@@ -483,54 +487,44 @@ def create_pace_speed_timeline(df: pd.DataFrame, interval: str = "quarterly",
     t = get_altair_theme(theme)
     
     # Filter to running and cycling activities with valid speed data (exclude hiking)
-    plot_df = df[
+    mask = (
         (df["Activity Group"].isin(["Running", "Cycling"])) &
         (df["Average Speed (km/h)"] > 0)
-    ].copy()
+    ).to_numpy()
     
-    if len(plot_df) == 0:
+    if not mask.any():
         return None
     
-    # Add period column based on interval
-    if interval == "monthly":
-        plot_df["Period"] = plot_df["Activity Date"].dt.strftime("%Y %b")
-    elif interval == "quarterly":
-        plot_df["Period"] = plot_df["Activity Date"].dt.to_period("Q").astype(str)
-    elif interval == "annual":
-        plot_df["Period"] = plot_df["Activity Date"].dt.to_period("Y").astype(str)
-    elif interval == "alltime":
-        plot_df["Period"] = "All Time"
-    else:
-        plot_df["Period"] = plot_df["Activity Date"].dt.to_period("Q").astype(str)
-    
-    # Calculate pace for running (min/km) and keep speed for cycling (km/h)
-    def calculate_display_value(row):
-        if row["Activity Group"] == "Running":
-            # Convert km/h to min/km
-            return 60 / row["Average Speed (km/h)"]
-        else:
-            # Keep as km/h for cycling
-            return row["Average Speed (km/h)"]
-    
-    plot_df["Display Value"] = plot_df.apply(calculate_display_value, axis=1)
+    # Build a frame with just the plotted columns rather than copying every
+    # column of the filtered activities
+    dates = df["Activity Date"][mask]
+    is_running = (df["Activity Group"][mask] == "Running").to_numpy()
+    speed_kmh = df["Average Speed (km/h)"].to_numpy()[mask]
+    plot_df = pd.DataFrame({
+        "Activity Date": dates,
+        # Period based on interval (chronologically ordered categorical)
+        "Period": get_period_categories(dates, interval),
+        # Pace for running (min/km) and speed for cycling (km/h)
+        "Display Value": np.where(is_running, 60 / speed_kmh, speed_kmh),
+    })
     
     # Separate pace and speed data
-    pace_data = plot_df[plot_df["Activity Group"] == "Running"].copy()
-    speed_data = plot_df[plot_df["Activity Group"] == "Cycling"].copy()
+    pace_data = plot_df[is_running]
+    speed_data = plot_df[~is_running]
     
     charts = []
     
     # Pace chart (running only) - find fastest (minimum) pace per period
     if len(pace_data) > 0:
         # Group by period, get fastest pace (minimum value)
-        pace_agg = pace_data.groupby("Period").agg({
+        pace_agg = pace_data.groupby("Period", observed=True).agg({
             "Display Value": "min",  # Fastest pace = lowest value
             "Activity Date": "first"  # Keep a date for reference
         }).reset_index()
         
         # Use bar chart for better visualization of per-period data
         pace_chart = alt.Chart(pace_agg).mark_bar(color="#12436D").encode(
-            x=alt.X('Period:N', title='Period', axis=alt.Axis(labelColor=t['font_color'], labelAngle=0)),
+            x=alt.X('Period:N', title='Period', sort=None, axis=alt.Axis(labelColor=t['font_color'], labelAngle=0)),
             y=alt.Y('Display Value:Q', 
                    title='Fastest Pace (min/km)', 
                    scale=alt.Scale(zero=False),  # Don't force zero to show variation better
@@ -545,13 +539,13 @@ def create_pace_speed_timeline(df: pd.DataFrame, interval: str = "quarterly",
     # Speed chart (cycling) - find fastest (maximum) speed per period
     if len(speed_data) > 0:
         # Group by period, get fastest speed (maximum value)
-        speed_agg = speed_data.groupby("Period").agg({
+        speed_agg = speed_data.groupby("Period", observed=True).agg({
             "Display Value": "max",  # Fastest speed = highest value
             "Activity Date": "first"
         }).reset_index()
         
         speed_chart = alt.Chart(speed_agg).mark_bar(color="#12436D").encode(
-            x=alt.X('Period:N', title='Period', axis=alt.Axis(labelColor=t['font_color'], labelAngle=0)),
+            x=alt.X('Period:N', title='Period', sort=None, axis=alt.Axis(labelColor=t['font_color'], labelAngle=0)),
             y=alt.Y('Display Value:Q', 
                    title='Fastest Speed (km/h)',
                    scale=alt.Scale(zero=False),
@@ -612,8 +606,9 @@ def create_time_of_day_pie(df: pd.DataFrame, title: str = "Activities by Time of
     t = get_altair_theme(theme)
     
     # Count activities by time of day
-    time_counts = df["Time of Day"].value_counts().reset_index()
-    time_counts.columns = ["Time of Day", "Count"]
+    time_counts = pd.DataFrame(
+        count_values(df["Time of Day"]).items(), columns=["Time of Day", "Count"]
+    )
     
     # Define colors for time of day periods - using consistent palette
     time_colors = {
@@ -769,7 +764,7 @@ def create_time_performance_chart(df: pd.DataFrame, title: str = "Average Perfor
     t = get_altair_theme(theme)
     
     # Calculate average metrics by time of day
-    time_stats = df.groupby("Time of Day").agg({
+    time_stats = df.groupby("Time of Day", observed=True).agg({
         "Distance (km)": "mean",
         "Duration (min)": "mean",
         "Average Speed (km/h)": "mean"
@@ -1,10 +1,16 @@
 """Unit tests for data_loader module."""
 
 import pytest
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 from io import StringIO
-from src.data_loader import load_strava_data, filter_by_activities, filter_by_date_range
+from src.data_loader import (
+    load_strava_data, filter_by_activities, filter_by_date_range,
+    get_aggregated_trends, get_stacked_activity_data, get_quarterly_stats, get_monthly_trends,
+    get_summary_stats, get_day_hour_heatmap_data, get_period_categories,
+    count_values, get_time_of_day_stats
+)
 
 
 def test_swimming_and_rowing_distance_conversion():
@@ -40,23 +46,120 @@ def test_swimming_and_rowing_distance_conversion():
     assert run_dist == 5.0, f"Run distance should remain 5.0 km, got {run_dist}"
 
 
-# Placeholder tests - implement with actual test data
+def test_stationary_activities_are_timed_by_elapsed_time():
+    """Test that stationary activities use Elapsed Time and the rest use Moving Time."""
+    csv_data = """Activity Date,Activity Type,Elapsed Time,Moving Time,Distance,Average Speed,Elevation Gain
+"Jan 1, 2024, 10:00:00 AM",Weight Training,3600,1200,0,0,0
+"Jan 2, 2024, 10:00:00 AM",Run,2000,1800,5.0,10.0,50
+"Jan 3, 2024, 10:00:00 AM",Yoga,2400,600,0,0,0
+"Jan 4, 2024, 10:00:00 AM",,900,300,1.0,4.0,0"""
+    
+    df = load_strava_data(StringIO(csv_data))
+    
+    assert list(df["Duration (min)"]) == [60.0, 30.0, 40.0, 5.0]
+
+
+def test_activity_dates_in_other_formats_are_parsed():
+    """Test that dates not in the Strava export format still parse."""
+    csv_data = """Activity Date,Activity Type,Moving Time,Distance,Average Speed,Elevation Gain
+"Jan 1, 2024, 10:00:00 AM",Run,1800,5.0,10.0,50
+2024-01-02 18:30:00,Run,1800,5.0,10.0,50
+not a date,Run,1800,5.0,10.0,50"""
+    
+    df = load_strava_data(StringIO(csv_data))
+    
+    # The unparseable row is dropped, the others keep their time of day
+    assert len(df) == 2
+    assert list(df["Hour of Day"]) == [10, 18]
+
+
+def test_timezone_aware_dates_are_parsed_as_utc():
+    """Test that ISO dates with a "Z" or UTC offset load as naive UTC times."""
+    csv_data = """Activity Date,Activity Type,Moving Time,Distance,Average Speed,Elevation Gain
+2024-01-02T18:30:00Z,Run,1800,5.0,10.0,50
+"Jan 1, 2024, 10:00:00 AM",Run,1800,5.0,10.0,50
+2024-01-03T07:15:00+02:00,Ride,3600,20.0,20.0,100"""
+    
+    df = load_strava_data(StringIO(csv_data))
+    
+    assert df["Activity Date"].dt.tz is None
+    assert list(df["Activity Date"]) == [
+        pd.Timestamp("2024-01-01 10:00"), pd.Timestamp("2024-01-02 18:30"), pd.Timestamp("2024-01-03 05:15")
+    ]
+    assert list(df["Hour of Day"]) == [10, 18, 5]
+
+
+def test_multiline_descriptions_in_large_exports():
+    """Test that quoted newlines in descriptions load when the file spans several Arrow blocks."""
+    header = "Activity Date,Activity Type,Activity Description,Moving Time,Distance,Average Speed,Elevation Gain\n"
+    row = '"Jan 1, 2024, 10:00:00 AM",Run,"Easy run\nfelt good",1800,5.0,10.0,50\n'
+    csv_data = header + row * 20000
+    assert len(csv_data.encode()) > 1024 * 1024  # larger than Arrow's default block size
+    
+    df = load_strava_data(StringIO(csv_data))
+    
+    assert len(df) == 20000
+    assert (df["Activity Description"] == "Easy run\nfelt good").all()
+
+
 def test_filter_by_activities():
     """Test filtering by activity groups."""
-    # TODO: Implement with sample data
-    pass
+    groups = ["Running", "Cycling", None, "Swimming", "Running"]
+    for activity_group in (pd.Categorical(groups), pd.Series(groups, dtype=object)):
+        df = pd.DataFrame({"Activity Group": activity_group, "Distance (km)": [5.0, 20.0, 1.0, 2.0, 10.0]})
+        
+        filtered = filter_by_activities(df, ["Running", "Swimming"])
+        assert list(filtered["Distance (km)"]) == [5.0, 2.0, 10.0]
+        
+        # Groups that don't occur, no selection, and the "__NONE__" marker
+        assert len(filter_by_activities(df, ["Hiking"])) == 0
+        assert len(filter_by_activities(df, [])) == 5
+        assert len(filter_by_activities(df, ["__NONE__"])) == 0
 
 
 def test_filter_by_date_range():
-    """Test date range filtering."""
-    # TODO: Implement with sample data
-    pass
+    """Test date range filtering keeps only activities on or after the cutoff."""
+    now = datetime.now()
+    df = pd.DataFrame({
+        "Activity Date": [now - timedelta(days=d) for d in (100, 40, 20, 5, 1)],
+        "Activity Group": ["Running"] * 5
+    })
+    
+    filtered = filter_by_date_range(df, 30)
+    assert len(filtered) == 3
+    assert (filtered["Activity Date"] >= now - timedelta(days=30)).all()
+    
+    # Unsorted input must give the same rows as sorted input
+    shuffled = df.iloc[[3, 0, 4, 2, 1]]
+    filtered_shuffled = filter_by_date_range(shuffled, 30)
+    assert sorted(filtered_shuffled.index) == sorted(filtered.index)
+    
+    # Nothing is older than the full window
+    assert len(filter_by_date_range(df, 365)) == 5
 
 
-def test_load_strava_data():
-    """Test data loading and preprocessing."""
-    # TODO: Implement with sample CSV
-    pass
+def test_load_strava_data(tmp_path, monkeypatch):
+    """Test that loading an unchanged file is served from the cache."""
+    import src.data_loader as data_loader
+    
+    calls = []
+    process = data_loader.load_and_process_data
+    monkeypatch.setattr(data_loader, "load_and_process_data",
+                        lambda source: calls.append(source) or process(source))
+    
+    csv_path = tmp_path / "activities.csv"
+    csv_path.write_text("""Activity Date,Activity Type,Moving Time,Distance,Average Speed,Elevation Gain
+"Jan 1, 2024, 10:00:00 AM",Run,1800,5.0,10.0,50""")
+    
+    first = load_strava_data(str(csv_path))
+    second = load_strava_data(csv_path)
+    
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert first["Activity Group"].tolist() == ["Running"]
+    
+    with pytest.raises(FileNotFoundError):
+        load_strava_data(str(tmp_path / "missing.csv"))
 
 
 def test_unknown_activity_types_map_to_other():
@@ -196,3 +299,265 @@ def test_mixed_known_and_unknown_activities():
     assert len(df[df["Activity Group"] == "Winter Sports"]) == 1
     assert len(df[df["Activity Group"] == "Team Sports"]) == 1
     assert len(df[df["Activity Group"] == "Other"]) == 4  # Kayaking, Yoga, Rock Climbing, Pilates
+
+
+def test_get_aggregated_trends_quarterly():
+    """Test quarterly aggregation sums, counts and cumulative distance."""
+    df = pd.DataFrame({
+        "Activity Date": [datetime(2024, 1, 5), datetime(2024, 2, 10), datetime(2024, 4, 1),
+                          datetime(2023, 11, 20)],
+        "Activity Type": ["Run", "Ride", "Run", "Swim"],
+        "Activity Group": ["Running", "Cycling", "Running", "Swimming"],
+        "Distance (km)": [10.0, 40.0, 5.0, 2.0],
+        "Duration (min)": [60.0, 120.0, 30.0, 45.0],
+        "Elevation Gain": [100.0, 300.0, 20.0, 0.0]
+    })
+    
+    trends = get_aggregated_trends(df, "quarterly")
+    
+    assert list(trends["Period"].astype(str)) == ["2023Q4", "2024Q1", "2024Q2"]
+    assert list(trends["Distance"]) == [2.0, 50.0, 5.0]
+    assert list(trends["Activity Count"]) == [1, 2, 1]
+    assert list(trends["Duration (hours)"]) == [0.8, 3.0, 0.5]
+    assert list(trends["Cumulative Distance"]) == [2.0, 52.0, 57.0]
+
+
+def test_quarterly_and_monthly_periods_sort_chronologically():
+    """Test that quarter and month labels sort by date, not by name."""
+    df = pd.DataFrame({
+        "Activity Date": [datetime(2024, 4, 2), datetime(2024, 8, 1), datetime(2023, 12, 30)],
+        "Activity Type": ["Run", "Run", "Ride"],
+        "Distance (km)": [5.0, 10.0, 30.0],
+        "Duration (min)": [30.0, 60.0, 90.0],
+        "Elevation Gain": [10.0, 20.0, 30.0]
+    })
+    
+    assert list(get_quarterly_stats(df)["Quarter"]) == ["2023Q4", "2024Q2", "2024Q3"]
+    
+    # "2024 Apr" would sort after "2024 Aug" as a plain string
+    assert list(get_monthly_trends(df)["Month"]) == ["2023 Dec", "2024 Apr", "2024 Aug"]
+
+
+def test_monthly_trends_and_stacked_data_are_chronological():
+    """Test that monthly periods and their cumulative totals follow the calendar."""
+    df = pd.DataFrame({
+        "Activity Date": [datetime(2024, 4, 2), datetime(2024, 8, 1), datetime(2024, 4, 20)],
+        "Activity Type": ["Run", "Ride", "Ride"],
+        "Activity Group": ["Running", "Cycling", "Cycling"],
+        "Distance (km)": [5.0, 10.0, 30.0],
+        "Duration (min)": [30.0, 60.0, 90.0],
+        "Elevation Gain": [10.0, 20.0, 30.0]
+    })
+    
+    trends = get_aggregated_trends(df, "monthly")
+    assert list(trends["Period"]) == ["2024 Apr", "2024 Aug"]
+    assert list(trends["Cumulative Distance"]) == [35.0, 45.0]
+    
+    stacked = get_stacked_activity_data(df, "monthly")
+    assert list(stacked["Period"]) == ["2024 Apr", "2024 Apr", "2024 Aug"]
+    assert list(stacked["Activity Group"]) == ["Cycling", "Running", "Cycling"]
+    assert list(stacked["Count"]) == [1, 1, 1]
+    
+    assert list(get_aggregated_trends(df, "alltime")["Period"]) == ["All Time"]
+
+
+def test_period_sums_per_group_skip_missing_values():
+    """Test per-period, per-group sums treat missing values as zero, including pre-1970 dates."""
+    df = pd.DataFrame({
+        "Activity Date": [datetime(1969, 12, 31), datetime(1969, 11, 2), datetime(2024, 6, 1),
+                          datetime(2024, 6, 2), datetime(2024, 6, 3)],
+        "Activity Type": ["Run", "Ride", "Run", "Run", "Ride"],
+        "Activity Group": ["Running", "Cycling", "Running", "Running", None],
+        "Distance (km)": [5.0, 20.0, np.nan, 7.5, 30.0],
+        "Duration (min)": [30.0, np.nan, 20.0, 45.0, 60.0],
+        "Elevation Gain": [np.nan, 100.0, 5.0, 15.0, 50.0]
+    })
+    
+    stacked = get_stacked_activity_data(df, "quarterly")
+    assert list(stacked["Period"]) == ["1969Q4", "1969Q4", "2024Q2"]
+    assert list(stacked["Activity Group"]) == ["Cycling", "Running", "Running"]
+    assert list(stacked["Count"]) == [1, 1, 2]
+    assert list(stacked["Distance"]) == [20.0, 5.0, 7.5]
+    
+    annual = get_aggregated_trends(df, "annual")
+    assert list(annual["Period"]) == ["1969", "2024"]
+    assert list(annual["Duration"]) == [30.0, 125.0]
+    assert list(annual["Elevation"]) == [100.0, 70.0]
+    
+    assert list(get_monthly_trends(df)["Month"]) == ["1969 Nov", "1969 Dec", "2024 Jun"]
+
+
+def test_summary_stats_count_activities_by_type_and_group():
+    """Test that type and group counts ignore missing values and list the most common first."""
+    df = pd.DataFrame({
+        "Activity Date": [datetime(2024, 1, d) for d in range(1, 5)],
+        "Activity Type": ["Ride", "Run", "Run", None],
+        "Activity Group": pd.Categorical(["Cycling", "Running", "Running", "Other"],
+                                         categories=["Cycling", "Other", "Running", "Swimming"]),
+        "Distance (km)": [20.0, 5.0, 5.0, 1.0],
+        "Duration (min)": [60.0, 30.0, 30.0, 10.0],
+        "Elevation Gain": [100.0, 10.0, 10.0, 0.0]
+    })
+    
+    stats = get_summary_stats(df)
+    
+    assert list(stats["activities_by_type"].items()) == [("Run", 2), ("Ride", 1)]
+    assert list(stats["activities_by_group"].items()) == [("Running", 2), ("Cycling", 1), ("Other", 1)]
+
+
+def test_count_values_ties_keep_first_appearance_order():
+    """Test that tied counts follow first appearance, matching value_counts on the string values."""
+    labels = ["Evening", "Afternoon", "Evening", "Afternoon", "Morning"]
+    categorical = pd.Series(pd.Categorical(labels, categories=["Morning", "Afternoon", "Evening", "Night"]))
+    
+    counts = count_values(categorical)
+    
+    assert list(counts.items()) == [("Evening", 2), ("Afternoon", 2), ("Morning", 1)]
+    assert counts == pd.Series(labels).value_counts().to_dict()
+    assert list(counts) == list(pd.Series(labels).value_counts().index)
+    assert list(count_values(pd.Series(labels))) == list(counts)
+
+
+def test_time_of_day_most_active_tie_goes_to_first_seen():
+    """Test that a tie for the most active time of day picks the slot seen first."""
+    df = pd.DataFrame({
+        "Time of Day": pd.Categorical(["Evening", "Afternoon", "Afternoon", "Evening"],
+                                      categories=["Morning", "Afternoon", "Evening", "Night"]),
+        "Distance (km)": [5.0, 5.0, 5.0, 5.0],
+        "Duration (min)": [30.0, 30.0, 30.0, 30.0],
+        "Average Speed (km/h)": [10.0, 10.0, 10.0, 10.0],
+        "Activity Type": ["Run", "Run", "Run", "Run"]
+    })
+    
+    assert get_time_of_day_stats(df)["most_active"] == "Evening"
+
+
+def test_day_hour_heatmap_counts_only_active_cells():
+    """Test that heatmap cells are counted per day and hour in calendar order."""
+    df = pd.DataFrame({
+        "Day of Week": ["Sunday", "Monday", "Sunday", "Monday"],
+        "Hour of Day": [9, 18, 9, 7],
+        "Activity Type": ["Run", "Ride", "Run", "Swim"]
+    })
+    
+    heatmap = get_day_hour_heatmap_data(df)
+    
+    assert list(heatmap["Day"]) == ["Monday", "Monday", "Sunday"]
+    assert list(heatmap["Hour"]) == [7, 18, 9]
+    assert list(heatmap["Count"]) == [1, 1, 2]
+
+
+def test_time_of_day_bucket_boundaries():
+    """Test that each hour lands in the right Time of Day bucket at the bin edges."""
+    hours = [0, 4, 5, 11, 12, 16, 17, 20, 21, 23]
+    rows = "\n".join(
+        f'"Jan 1, 2024, {datetime(2024, 1, 1, h).strftime("%I:%M:%S %p")}",Run,1800,5.0,10.0,50'
+        for h in hours
+    )
+    csv_data = "Activity Date,Activity Type,Moving Time,Distance,Average Speed,Elevation Gain\n" + rows
+    
+    df = load_strava_data(StringIO(csv_data))
+    
+    assert list(df["Hour of Day"]) == hours
+    assert list(df["Time of Day"]) == [
+        "Night", "Night", "Morning", "Morning", "Afternoon",
+        "Afternoon", "Evening", "Evening", "Night", "Night"
+    ]
+
+
+def test_label_columns_are_categorical():
+    """Test that the low-cardinality label columns are loaded as categoricals."""
+    csv_data = """Activity Date,Activity Type,Moving Time,Distance,Average Speed,Elevation Gain
+"Jan 1, 2024, 10:00:00 AM",Run,1800,5.0,10.0,50
+"Jan 2, 2024, 07:00:00 PM",Kayaking,3600,8.0,2.0,0
+"Jan 3, 2024, 06:00:00 AM",,600,1.0,2.0,0"""
+    
+    df = load_strava_data(StringIO(csv_data))
+    
+    for column in ["Activity Type", "Activity Group", "Time of Day", "Day of Week"]:
+        assert isinstance(df[column].dtype, pd.CategoricalDtype), f"{column} should be categorical"
+    
+    assert list(df["Activity Type"]) == ["Run", "Kayaking", "Unknown"]
+    assert list(df["Activity Group"]) == ["Running", "Other", "Other"]
+    assert list(df["Time of Day"].cat.categories) == ["Morning", "Afternoon", "Evening", "Night"]
+
+
+def test_derived_metrics_sum_without_float32_noise():
+    """Test that derived metric columns stay float64 so displayed totals round cleanly."""
+    rows = "\n".join(f'"Jan {day}, 2024, 10:00:00 AM",Run,1800,7.03,10.1,12.3' for day in range(1, 29))
+    csv_data = "Activity Date,Activity Type,Moving Time,Distance,Average Speed,Elevation Gain\n" + rows
+    
+    df = load_strava_data(StringIO(csv_data))
+    
+    for column in ["Distance (km)", "Duration (min)", "Elevation (m)", "Average Speed (km/h)"]:
+        assert df[column].dtype == np.float64, f"{column} should be float64"
+    assert round(df["Distance (km)"].sum(), 2) == 196.84
+    assert round(df["Elevation (m)"].sum(), 1) == 344.4
+
+
+def test_period_categories_are_chronological():
+    """Test that period labels are built per date and ordered by date, not name."""
+    dates = pd.Series([datetime(2024, 8, 1), datetime(2024, 4, 2), datetime(2023, 12, 30),
+                       datetime(2024, 4, 20)])
+    
+    monthly = get_period_categories(dates, "monthly")
+    assert list(monthly) == ["2024 Aug", "2024 Apr", "2023 Dec", "2024 Apr"]
+    assert list(monthly.categories) == ["2023 Dec", "2024 Apr", "2024 Aug"]
+    
+    assert list(get_period_categories(dates, "quarterly").categories) == ["2023Q4", "2024Q2", "2024Q3"]
+    assert list(get_period_categories(dates, "annual").categories) == ["2023", "2024"]
+    assert list(get_period_categories(dates, "alltime")) == ["All Time"] * 4
+
+
+def test_non_numeric_values_in_numeric_columns_are_coerced():
+    """Test that a stray non-numeric value becomes NaN instead of failing the load."""
+    csv_data = """Activity Date,Activity Type,Moving Time,Distance,Average Speed,Elevation Gain
+"Jan 1, 2024, 10:00:00 AM",Run,1800,n/a,10.0,50
+"Jan 2, 2024, 10:00:00 AM",Run,1800,5.0,10.0,"""
+    
+    df = load_strava_data(StringIO(csv_data))
+    
+    assert df["Distance"].isna().tolist() == [True, False]
+    assert list(df["Distance (km)"]) == [0.0, 5.0]
+    assert list(df["Elevation Gain"]) == [50.0, 0.0]
+
+
+def test_only_used_columns_are_loaded():
+    """Test that unused export columns are skipped and repeated headers keep the first."""
+    csv_data = """Activity ID,Activity Date,Activity Type,Elapsed Time,Distance,Max Heart Rate,Average Speed,Elevation Gain,Elapsed Time,Distance
+1,"Jan 1, 2024, 10:00:00 AM",Run,1800,5.0,170,2.8,20,1790,5000.0"""
+    
+    df = load_strava_data(StringIO(csv_data))
+    
+    assert "Activity ID" not in df.columns
+    assert "Max Heart Rate" not in df.columns
+    assert "Distance.1" not in df.columns
+    assert list(df["Elapsed Time"]) == [1800]
+    assert list(df["Distance (km)"]) == [5.0]
+    assert list(df.columns).count("Distance") == 1
+    
+    # The untyped fallback read (a non-numeric value) also keeps the first occurrence
+    fallback = load_strava_data(StringIO(csv_data.replace(",20,", ",abc,")))
+    assert "Distance.1" not in fallback.columns
+    assert list(fallback["Elapsed Time"]) == [1800]
+    assert list(fallback["Distance (km)"]) == [5.0]
+
+
+def test_changes_to_loaded_data_do_not_leak_into_the_cache(tmp_path):
+    """Test that the cached frame is unaffected by edits and reloads when the file changes."""
+    csv_data = """Activity Date,Activity Type,Moving Time,Distance,Average Speed,Elevation Gain
+"Jan 1, 2024, 10:00:00 AM",Run,1800,5.0,10.0,50"""
+    
+    first = load_strava_data(StringIO(csv_data))
+    first["Distance (km)"] = 99.0
+    first.loc[first.index[0], "Elevation Gain"] = -1.0
+    
+    second = load_strava_data(StringIO(csv_data))
+    assert list(second["Distance (km)"]) == [5.0]
+    assert list(second["Elevation Gain"]) == [50.0]
+    
+    csv_path = tmp_path / "activities.csv"
+    csv_path.write_text(csv_data)
+    assert len(load_strava_data(str(csv_path))) == 1
+    csv_path.write_text(csv_data + '\n"Jan 2, 2024, 10:00:00 AM",Run,1800,5.0,10.0,50')
+    assert len(load_strava_data(str(csv_path))) == 2
@@ -3,7 +3,7 @@
 import pytest
 import pandas as pd
 from datetime import datetime
-from src.utils import is_race, format_race_time, get_races
+from src.utils import is_race, format_race_time, format_race_times, get_races, get_race_mask
 
 
 class TestIsRace:
@@ -84,11 +84,27 @@ class TestIsRace:
         # But anti-patterns should still apply
         assert is_race("Long run", "almost marathon distance") is False
     
+    def test_cross_country_needs_whole_word(self):
+        """Test that XC only counts as a whole word."""
+        assert is_race("County XC") is True
+        assert is_race("xc") is True
+        assert is_race("XC-league round 3") is True
+        assert is_race("Exercise bike") is False
+        assert is_race("Excellent ride") is False
+    
     def test_edge_cases(self):
         """Test edge cases like empty strings."""
         assert is_race("") is False
         assert is_race("", "") is False
         assert is_race("   ") is False
+    
+    def test_missing_and_non_string_values(self):
+        """Test that None, NaN and non-string names are handled without errors."""
+        assert is_race(None) is False
+        assert is_race(float("nan"), "parkrun") is True
+        assert is_race("Morning Run", None) is False
+        assert is_race("Morning Run", float("nan")) is False
+        assert is_race(10000, "marathon") is True
 
 
 class TestFormatRaceTime:
@@ -120,6 +136,15 @@ class TestFormatRaceTime:
         assert format_race_time(3600) == "1:00:00"
         assert format_race_time(7200) == "2:00:00"
         assert format_race_time(3599) == "59:59"  # Just under 1 hour
+    
+    def test_series_matches_scalar(self):
+        """Test that formatting a Series matches format_race_time, with N/A for missing times."""
+        seconds = pd.Series([3661, 125, 0, 3599.9, 12969, None], index=[10, 11, 12, 13, 14, 15])
+        
+        formatted = format_race_times(seconds)
+        
+        assert formatted.tolist() == ["1:01:01", "2:05", "0:00", "59:59", "3:36:09", "N/A"]
+        assert formatted.index.tolist() == [10, 11, 12, 13, 14, 15]
 
 
 class TestGetRaces:
@@ -325,3 +350,54 @@ class TestGetRaces:
         assert 'Morning Run' not in race_names
         assert '1/3 marathon' not in race_names
         assert 'Almost half marathon' not in race_names
+
+
+class TestGetRaceMask:
+    """Tests for vectorized race detection."""
+    
+    def test_matches_is_race(self):
+        """Test that the mask agrees with is_race activity by activity."""
+        names = [
+            "Swindon parkrun", "Morning Run", "Chippenham Half", "Bath half", "halfway",
+            "County XC", "Exercise bike", "London 10,000", "10k route", "Recovery 10k",
+            "relay", "Race across the world", "", None, "Evening Ride", "Almost half marathon"
+        ]
+        descriptions = [
+            "", "club champs race", None, "", "", "", "", "", "", "race",
+            "", "", "parkrun", "Half Marathon", "pre race warm up", ""
+        ]
+        df = pd.DataFrame({'Activity Name': names, 'Activity Description': descriptions})
+        
+        expected = [is_race(name, desc) for name, desc in zip(names, descriptions)]
+        assert get_race_mask(df).tolist() == expected
+    
+    def test_missing_text_columns(self):
+        """Test that missing name or description columns count as empty."""
+        assert get_race_mask(pd.DataFrame({'Activity Name': ['York parkrun', 'Lunch Run']})).tolist() == [True, False]
+        assert get_race_mask(pd.DataFrame({'Activity Description': ['Yorkshire marathon']})).tolist() == [True]
+        assert get_race_mask(pd.DataFrame({'Activity Name': []})).tolist() == []
+    
+    def test_keyword_patterns_compile_for_arrow(self):
+        """Test that the tier patterns match the same race and non-race texts on Arrow strings as in Python."""
+        pa = pytest.importorskip("pyarrow")
+        pc = pytest.importorskip("pyarrow.compute")
+        from src import utils
+        
+        texts = ["york parkrun", "almost half marathon", "10k route", "london 10,000", "exercise bike", "lunch run"]
+        arrow_texts = pd.Series(texts, dtype=pd.StringDtype("pyarrow"))
+        expected = {
+            utils._RACE_PRIORITY_ANTI_RE: [False, True, False, False, False, False],
+            utils._RACE_STRONG_RE: [True, True, False, False, False, False],
+            utils._RACE_WEAK_ANTI_RE: [False, False, True, False, False, False],
+            utils._RACE_MEDIUM_RE: [False, False, True, True, False, False],
+        }
+        
+        for pattern, hits in expected.items():
+            assert pc.match_substring_regex(pa.array(texts), pattern.pattern).to_pylist() == hits
+            assert arrow_texts.str.contains(pattern.pattern, regex=True).tolist() == hits
+            assert [pattern.search(text) is not None for text in texts] == hits
+        
+        # The full mask gives the same answers on Arrow-backed text columns
+        names = ["York parkrun", "Lunch Run", "Recovery 10k", "Bath 10k", "Almost half marathon"]
+        df = pd.DataFrame({'Activity Name': pd.Series(names, dtype=pd.StringDtype("pyarrow"))})
+        assert get_race_mask(df).tolist() == [True, False, False, True, False]
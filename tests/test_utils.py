@@ -1,9 +1,11 @@
 """Unit tests for utils module."""
 
 import pytest
+import warnings
 import pandas as pd
 from datetime import datetime
-from src.utils import get_personal_records, calculate_summary_stats, calculate_fun_metrics
+from src.utils import get_personal_records, calculate_summary_stats, calculate_fun_metrics, get_best_race_times, calculate_exercise_obsession_score
+from src.utils import _count_active_weeks, _day_numbers, _date_span_days, calculate_cheeky_metrics
 
 
 def test_get_personal_records_dynamic():
@@ -62,6 +64,26 @@ def test_get_personal_records_different_values():
     assert prs1['fastest_speed'] != prs2['fastest_speed'], "PRs should differ with different data"
 
 
+def test_get_personal_records_skips_slow_moving_time():
+    """Test that GPS-error activities are skipped for categorical and plain groups."""
+    groups = ['Running', 'Cycling', 'Strength', None]
+    test_data = {
+        'Distance (km)': [10.0, 1.0, 0.0, 5.0],
+        'Moving Time': [3600.0, 36000.0, 7200.0, 90000.0],  # Ride at 0.1 km/h is a GPS error
+        'Duration (min)': [60.0, 600.0, 120.0, 1500.0],
+        'Elevation (m)': [100.0, 10.0, 0.0, 0.0],
+        'Average Speed (km/h)': [10.0, 0.1, 0.0, 0.2]
+    }
+    
+    for activity_group in (pd.Categorical(groups), pd.Series(groups, dtype=object)):
+        df = pd.DataFrame(test_data)
+        df['Activity Group'] = activity_group
+        prs = get_personal_records(df)
+        
+        # The slow ride and the ungrouped activity are ignored; strength has no minimum
+        assert prs['longest_duration'] == 120.0
+
+
 def test_get_personal_records_no_hardcoded_3000():
     """Specifically test that 3000 and 43 are not hardcoded values."""
     # Create data that should NOT return 3000 or 43
@@ -129,3 +151,114 @@ def test_calculate_summary_stats_with_large_values():
     assert stats['total_duration'] == 150.0, "Should correctly sum to value needing comma formatting"
     assert stats['total_elevation'] == 12000.0, "Should correctly sum to value needing comma formatting"
 
+
+def test_get_best_race_times_per_distance():
+    """Test that the fastest running time is picked within each distance range."""
+    test_data = {
+        'Activity Date': [datetime(2024, 1, d) for d in range(1, 8)],
+        'Activity Name': ['Parkrun', 'Fast parkrun', 'Too long', 'Bike', '10k', 'Marathon', 'Slow 10k'],
+        'Activity Group': ['Running', 'Running', 'Running', 'Cycling', 'Running', 'Running', 'Running'],
+        'Distance (km)': [4.8, 5.2, 5.3, 5.0, 10.0, 42.2, 10.5],
+        'Elapsed Time': [1500, 1300, 1000, 600, 2700, 14400, 3000]
+    }
+    df = pd.DataFrame(test_data)
+    
+    best = get_best_race_times(df)
+    
+    # Range bounds are inclusive; 5.3 km and cycling don't count as 5k
+    assert best['5k']['name'] == 'Fast parkrun'
+    assert best['5k']['time_formatted'] == '21:40'
+    assert best['10k']['name'] == '10k'
+    assert best['half'] is None
+    assert best['marathon']['time_formatted'] == '4:00:00'
+
+
+def test_obsession_score_caps_consistency():
+    """Test that two activities in consecutive weeks cannot push consistency past 20 points."""
+    df = pd.DataFrame({
+        'Activity Date': [datetime(2024, 1, 7), datetime(2024, 1, 8)],  # Sunday, then Monday
+        'Activity Type': ['Run', 'Run'],
+        'Duration (min)': [30.0, 30.0]
+    })
+    
+    score, level, _ = calculate_exercise_obsession_score(df)
+    
+    # Frequency 25 + volume 17.5 + consistency 20 + variety 3 + balance 7.5.
+    # Before the cap, consistency scored 40 here and the total was 93; the
+    # drop to 73 is the intended fix, not a regression.
+    assert score == 73
+    assert level == "Fitness Fanatic 💪"  # 70-84 band
+
+
+def test_count_active_weeks_matches_period_weeks():
+    """Test that integer week numbers agree with pandas' Monday-based weekly periods."""
+    dates = pd.Series(pd.to_datetime([
+        '1969-12-28 23:59', '1969-12-29 00:00',  # Sunday/Monday either side of a week boundary
+        '2024-01-07 22:00', '2024-01-08 06:00',
+        '2024-01-10 12:00', None
+    ]))
+    
+    assert _count_active_weeks(_day_numbers(dates)) == dates.dt.to_period('W').nunique() == 4
+    # The obsession score derives weekdays from the same day numbers
+    assert ((_day_numbers(dates) + 3) % 7 == dates.dropna().dt.dayofweek.to_numpy()).all()
+
+
+def test_obsession_score_ignores_unused_activity_categories():
+    """Test that variety counts the types present, not every category left over from filtering."""
+    df = pd.DataFrame({
+        'Activity Date': [datetime(2024, 1, 7), datetime(2024, 1, 8)],
+        'Activity Type': pd.Categorical(['Run', 'Run'], categories=['Hike', 'Ride', 'Run', 'Swim', 'Walk']),
+        'Duration (min)': [30.0, 30.0]
+    })
+    
+    score, _, _ = calculate_exercise_obsession_score(df)
+    
+    # Same as the plain two-run case: one type scores 3 variety points, not 15
+    assert score == 73
+
+
+def test_cheeky_metrics_time_comparisons_skip_missing_durations():
+    """Test that cheeky time comparisons come from one duration total, skipping missing values."""
+    df = pd.DataFrame({
+        'Distance (km)': [10.0, 12.0, 0.0],
+        'Elevation (m)': [100.0, 230.0, 0.0],
+        'Duration (min)': [330.0, 330.0, float('nan')]
+    })
+    
+    cheeky = calculate_cheeky_metrics(df)
+    
+    assert cheeky['friends_episodes'] == pytest.approx(30.0)  # 660 min / 22
+    assert cheeky['eiffel_towers'] == pytest.approx(1.0)  # 330 m
+    # 22 km in 11 hours is 2 km/h; a sloth at 0.24 km/h takes 8.33x as long
+    assert cheeky['faster_than_sloth'] == pytest.approx(2.0 / 0.24)
+
+
+def test_date_span_days_handles_unsorted_and_missing_dates():
+    """Test that the date span matches Timedelta.days regardless of row order or NaT."""
+    dates = pd.Series(pd.to_datetime(['2024-03-10 08:00', None, '2024-01-01 23:00', '2024-02-01 07:00']))
+    
+    assert _date_span_days(dates) == (dates.max() - dates.min()).days == 68
+    assert _date_span_days(dates.iloc[:0]) == 0
+    assert _date_span_days(pd.Series([pd.NaT, pd.NaT], dtype='datetime64[ns]')) == 0
+
+
+def test_metric_functions_handle_empty_frame():
+    """Test that every metric function returns zeros/NaNs for an empty frame without warnings."""
+    df = pd.DataFrame({
+        'Activity Date': pd.Series([], dtype='datetime64[ns]'),
+        'Activity Type': pd.Categorical([]),
+        'Activity Group': pd.Categorical([]),
+        'Distance (km)': pd.Series([], dtype=float),
+        'Elevation (m)': pd.Series([], dtype=float),
+        'Duration (min)': pd.Series([], dtype=float),
+        'Average Speed (km/h)': pd.Series([], dtype=float),
+        'Moving Time': pd.Series([], dtype=float)
+    })
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert calculate_exercise_obsession_score(df)[0] == 0
+        assert calculate_summary_stats(df)['total_distance'] == 0
+        assert calculate_fun_metrics(df)['activities_per_week'] == 0
+        assert calculate_cheeky_metrics(df)['faster_than_sloth'] == 0
+        assert all(pd.isna(value) for value in get_personal_records(df).values())
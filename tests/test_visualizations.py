@@ -0,0 +1,52 @@
+"""Unit tests for the legacy Plotly visualizations module."""
+
+import pytest
+import pandas as pd
+
+pytest.importorskip("plotly")
+
+from src.config import PLOTLY_DARK_THEME
+from src.visualizations import (
+    create_exercise_obsession_gauge, create_duration_histogram, create_quarterly_trends_chart,
+    create_activity_type_pie
+)
+
+
+def test_gauge_histogram_and_trends_build_validated_figures():
+    """Test that the hand-built figures use regular traces and keep their titles and theme."""
+    gauge = create_exercise_obsession_gauge(73, "Fitness Fanatic")
+    assert gauge.data[0].type == "indicator"
+    assert gauge.data[0].value == 73
+    assert gauge.data[0].title.text == "<b>Fitness Fanatic</b>"
+    
+    df = pd.DataFrame({"Duration (min)": [10.0, 45.0, 60.0, 120.0]})
+    histogram = create_duration_histogram(df, title="Durations", nbins=5, theme=PLOTLY_DARK_THEME)
+    assert histogram.data[0].type == "histogram"
+    assert histogram.data[0].nbinsx == 5
+    assert histogram.layout.title.text == "Durations"
+    assert histogram.layout.xaxis.title.text == "Duration (min)"
+    assert histogram.layout.paper_bgcolor == PLOTLY_DARK_THEME["paper_bgcolor"]
+    
+    period_data = pd.DataFrame({
+        "Period": ["2024Q1", "2024Q2", "2024Q3"],
+        "Distance": [10.0, 20.0, 30.0],
+        "Activity Count": [1, 2, 3]
+    })
+    trends = create_quarterly_trends_chart(period_data)
+    assert [trace.type for trace in trends.data] == ["scatter", "scatter"]
+    assert trends.data[1].yaxis == "y2"
+    assert trends.layout.yaxis2.title.text == "Activity Count"
+
+
+def test_activity_pie_slices_are_pinned_most_common_first():
+    """Test that pie slices run most common first, ties in order of appearance, without Plotly re-sorting."""
+    groups = ["Running", "Hiking", "Cycling", "Hiking", "Cycling", "Running", "Cycling"]
+    df = pd.DataFrame({
+        "Activity Group": pd.Categorical(groups, categories=["Cycling", "Hiking", "Other", "Running"])
+    })
+    
+    fig = create_activity_type_pie(df)
+    
+    assert list(fig.data[0].labels) == ["Cycling", "Running", "Hiking"]
+    assert list(fig.data[0].values) == [3, 2, 2]
+    assert fig.data[0].sort is False